@@ -0,0 +1,174 @@
+"""
+Benchmark mode chunked pada task transform: menjalankan TransformAmazonData, TransformProductData,
+dan TransformMydramalistData secara in-memory dan per potongan (chunked) pada data sintetis,
+memastikan hasil keduanya sama, serta mencatat waktu dan peak memory (setiap run di proses terpisah).
+
+Data product sengaja berisi nilai kosong panjang yang melewati beberapa potongan dan nilai kosong
+di akhir file, sehingga backfill antar potongan ikut diuji. Potongan data review diawali tanggal bulan Mei,
+sehingga parsing tanggal yang bergantung pada awal potongan ikut terdeteksi.
+
+Contoh menjalankan dari root repository:
+    python -m benchmark.bench_chunked --rows 500000 --chunk-size 50000
+"""
+import argparse
+import functools
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import luigi
+import numpy as np
+import pandas as pd
+
+from benchmark.synthetic import amazon_sales_frame, product_pricing_frame, review_bodies
+from etl_pipeline import TransformAmazonData, TransformMydramalistData, TransformProductData
+from src.helper.metrics_helper import peak_memory_mb
+from src.helper.storage_helper import STORAGE_FORMATS, DataFrameTarget, resolve_format
+
+TRANSFORMS = {
+    "amazon": TransformAmazonData,
+    "product": TransformProductData,
+    "mydramalist": TransformMydramalistData,
+}
+
+
+def review_frame(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "reviewer": [f"user{idx}" for idx in range(rows)],
+        "profile_link": [f"/profile/user{idx}" for idx in range(rows)],
+        "review_date": pd.to_datetime(rng.integers(1.4e9, 1.7e9, size=rows), unit="s").strftime("%b %d, %Y"),
+        "helpful_count": rng.integers(0, 500, size=rows),
+        "overall_rating": rng.integers(1, 11, size=rows).astype(float),
+        "review_body": review_bodies(rows, seed),
+    })
+
+
+def boundary_product_frame(rows, chunk_size):
+    # Nilai kosong yang melewati beberapa potongan dan nilai kosong di akhir data
+    data = product_pricing_frame(rows)
+    start = min(chunk_size // 2, rows)
+    stop = min(start + 3 * chunk_size, rows)
+    data.loc[start:stop, ["prices.shipping", "dateAdded"]] = np.nan
+    data.loc[rows - min(chunk_size // 3, rows):, ["prices.shipping", "prices.dateSeen"]] = np.nan
+    return data
+
+
+def boundary_review_frame(rows, starts):
+    # Potongan yang diawali tanggal bulan Mei: tanpa format eksplisit pandas menebak format dari nilai pertama
+    # ("May" cocok dengan %B) sehingga bulan lain di potongan itu menjadi NaT. Baris pertama sengaja bukan Mei
+    data = review_frame(rows)
+    data.loc[0, "review_date"] = "Jan 22, 2017"
+    data.loc[[start for start in starts if 0 < start < rows], "review_date"] = "May 05, 2018"
+    return data
+
+
+def build_inputs(rows, chunk_size, directory, storage_format, review_starts=None):
+    # review_starts berisi baris awal potongan/rentang data review, default setiap chunk_size baris
+    review_rows = max(rows // 10, 1)
+    if review_starts is None:
+        review_starts = range(chunk_size, review_rows, chunk_size)
+    frames = {
+        "amazon": amazon_sales_frame(rows),
+        "product": boundary_product_frame(rows, chunk_size),
+        "mydramalist": boundary_review_frame(review_rows, review_starts),
+    }
+    paths = {}
+    for name, data in frames.items():
+        target = DataFrameTarget(os.path.join(directory, f"extract_{name}_data"), storage_format)
+        target.write(data)
+        paths[name] = target.path
+    return paths
+
+
+def source_targets(input_path, storage_format):
+    return {"data": DataFrameTarget(input_path, storage_format)}
+
+
+def run_transform(name, input_path, output_path, storage_format, chunked, chunk_size, processes=1):
+    # Dijalankan di proses terpisah sehingga peak memory setiap mode tidak tercampur
+    luigi.configuration.get_config().set("StorageConfig", "format", storage_format)
+    task = TRANSFORMS[name](output_file=output_path, chunked=chunked, chunk_size=chunk_size, processes=processes)
+    # Task ikut di-pickle ke proses worker pada mode paralel, sehingga input tidak boleh berupa lambda
+    task.input = functools.partial(source_targets, input_path, storage_format)
+
+    start_time = time.perf_counter()
+    task.run()
+    return time.perf_counter() - start_time, peak_memory_mb()
+
+
+def compare_outputs(name, paths, storage_format):
+    outputs = [DataFrameTarget(path, storage_format).read() for path in paths]
+
+    # Urutan kategori boleh berbeda, nilai dan tipe kolom harus sama
+    try:
+        pd.testing.assert_frame_equal(*outputs, check_categorical=False)
+    except AssertionError as error:
+        print(f"{name}: chunked output differs from in-memory output\n{error}", file=sys.stderr)
+        return False, len(outputs[1])
+    return True, len(outputs[1])
+
+
+def in_process(func, *args):
+    # Setiap langkah berjalan di proses baru dan proses utama tidak pernah memegang data,
+    # karena peak memory (max RSS) proses baru ikut mewarisi nilai proses induknya
+    # (ProcessPoolExecutor karena worker multiprocessing.Pool tidak boleh membuat proses lagi)
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        return executor.submit(func, *args).result()
+
+
+def run(rows, chunk_size, storage_format):
+    results = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        inputs = in_process(build_inputs, rows, chunk_size, directory, storage_format)
+
+        for name, input_path in inputs.items():
+            output_paths = []
+            for mode in ["in-memory", "chunked"]:
+                output_path = os.path.join(directory, f"transform_{name}_{mode}")
+                seconds, memory = in_process(
+                    run_transform, name, input_path, output_path, storage_format, mode == "chunked", chunk_size
+                )
+                output_paths.append(output_path)
+                results.append({
+                    "benchmark": "chunked",
+                    "dataset": name,
+                    "mode": mode,
+                    "format": storage_format,
+                    "chunk_size": chunk_size,
+                    "seconds": round(seconds, 4),
+                    "peak_memory_mb": round(memory, 1),
+                })
+
+            identical, output_rows = in_process(compare_outputs, name, output_paths, storage_format)
+            for result in results[-2:]:
+                result.update(rows=output_rows, identical=identical)
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=500000)
+    parser.add_argument("--chunk-size", type=int, default=50000)
+    parser.add_argument("--format", choices=STORAGE_FORMATS, default="auto")
+    parser.add_argument("--output", help="Append hasil dalam format JSON lines ke file ini")
+    args = parser.parse_args()
+
+    results = run(args.rows, args.chunk_size, resolve_format(args.format))
+    for result in results:
+        print(f"{result['dataset']:>11} {result['mode']:>9}: {result['seconds']:>7.2f}s, "
+              f"peak memory {result['peak_memory_mb']:>8.1f} MB, identical={result['identical']}")
+
+    if args.output:
+        with open(args.output, "a", encoding="utf-8") as output_file:
+            for result in results:
+                output_file.write(json.dumps(result) + "\n")
+
+    if not all(result["identical"] for result in results):
+        sys.exit(1)
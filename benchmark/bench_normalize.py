@@ -0,0 +1,88 @@
+"""
+Benchmark normalisasi kolom kategori TransformProductData: membandingkan DataFrame.replace + regex per baris
+(implementasi awal) dengan normalize_categorical (mapping per nilai unik pada kolom category),
+dan memastikan hasil keduanya sama.
+
+Contoh menjalankan dari root repository:
+    python -m benchmark.bench_normalize --rows 1000000
+"""
+import argparse
+import io
+import json
+import time
+
+import pandas as pd
+
+from benchmark.synthetic import product_pricing_frame
+from src.helper.transform_helper import PRODUCT_NORMALIZATION_RULES, normalize_categorical
+
+COLUMNS = {
+    'prices.availability': 'Availability', 'prices.condition': 'Condition',
+    'prices.isSale': 'isSale', 'prices.shipping': 'Shipping',
+}
+
+
+def legacy_normalize(data):
+    # Salinan implementasi awal TransformProductData.run sebagai baseline
+    data = data.copy()
+    data.replace({col: rule['map'] for col, rule in PRODUCT_NORMALIZATION_RULES.items()}, inplace=True)
+    data['Shipping'] = data['Shipping'].replace(r'.*\bUSD\b.*|.*\bCAD\b.*', 'Charges Apply', regex=True)
+    data['Shipping'] = data['Shipping'].bfill()
+    return data
+
+
+def categorical_normalize(data):
+    data = data.copy()
+    for col, rule in PRODUCT_NORMALIZATION_RULES.items():
+        data[col] = normalize_categorical(data[col], rule)
+    return data
+
+
+def load_frame(rows):
+    # Round trip CSV agar tipe kolom sama seperti saat dibaca oleh TransformProductData
+    buffer = io.StringIO()
+    product_pricing_frame(rows).to_csv(buffer, index=False)
+    buffer.seek(0)
+    return pd.read_csv(buffer, usecols=list(COLUMNS)).rename(columns=COLUMNS)
+
+
+def run(rows):
+    data = load_frame(rows)
+    results = []
+    outputs = {}
+
+    for name, normalize in [("legacy", legacy_normalize), ("categorical", categorical_normalize)]:
+        start_time = time.perf_counter()
+        outputs[name] = normalize(data)
+        elapsed = time.perf_counter() - start_time
+        results.append({
+            "benchmark": "normalize",
+            "implementation": name,
+            "rows": rows,
+            "seconds": round(elapsed, 4),
+            "rows_per_sec": round(rows / elapsed, 1),
+            "memory_mb": round(outputs[name].memory_usage(deep=True).sum() / 1024 ** 2, 1),
+        })
+
+    # Hasil baru bertipe category, sehingga dibandingkan sebagai object
+    identical = outputs["legacy"].astype(object).equals(outputs["categorical"].astype(object))
+    for result in results:
+        result["identical"] = identical
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--output", help="Append hasil dalam format JSON lines ke file ini")
+    args = parser.parse_args()
+
+    results = run(args.rows)
+    for result in results:
+        print(f"{result['implementation']:>11}: {result['seconds']:>8.2f}s, {result['rows_per_sec']:>12.1f} rows/sec, "
+              f"{result['memory_mb']:>8.1f} MB, identical={result['identical']}")
+
+    if args.output:
+        with open(args.output, "a", encoding="utf-8") as output_file:
+            for result in results:
+                output_file.write(json.dumps(result) + "\n")
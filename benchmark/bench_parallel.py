@@ -0,0 +1,84 @@
+"""
+Benchmark mode paralel pada task transform: menjalankan setiap task transform dengan beberapa jumlah
+proses worker (`processes`), mencatat rows/sec dan speedup dibanding satu proses, serta memastikan
+hasilnya sama dengan transform in-memory.
+
+Contoh menjalankan dari root repository:
+    python -m benchmark.bench_parallel --rows 1000000 --processes 1 2 4
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import tempfile
+
+from benchmark.bench_chunked import TRANSFORMS, build_inputs, compare_outputs, in_process, run_transform
+from src.helper.storage_helper import STORAGE_FORMATS, resolve_format
+
+
+def run(rows, processes_list, datasets, storage_format, chunk_size=100000):
+    results = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        # chunk_size hanya dipakai untuk letak nilai kosong pada data product.
+        # Rentang baris data review untuk setiap jumlah proses diawali tanggal bulan Mei
+        review_rows = max(rows // 10, 1)
+        review_starts = {
+            start for processes in processes_list
+            for start in range(0, review_rows, max(math.ceil(review_rows / processes), 1))
+        }
+        inputs = in_process(build_inputs, rows, max(rows // 10, 1), directory, storage_format, review_starts)
+
+        for name in datasets:
+            expected_path = os.path.join(directory, f"transform_{name}_expected")
+            run_transform(name, inputs[name], expected_path, storage_format, False, 0)
+            baseline = None
+
+            # Transform dijalankan langsung di proses utama (seperti di dalam pipeline),
+            # proses worker pada mode paralel dibuat oleh task itu sendiri
+            for processes in processes_list:
+                output_path = os.path.join(directory, f"transform_{name}_{processes}")
+                # chunk_size hanya dipakai jika input csv (diproses berurutan per potongan)
+                seconds, _ = run_transform(name, inputs[name], output_path, storage_format, False, chunk_size,
+                                           processes)
+                identical, output_rows = in_process(compare_outputs, name, [expected_path, output_path],
+                                                    storage_format)
+                baseline = baseline or seconds
+                results.append({
+                    "benchmark": "parallel",
+                    "dataset": name,
+                    "processes": processes,
+                    "format": storage_format,
+                    "rows": output_rows,
+                    "seconds": round(seconds, 4),
+                    "rows_per_sec": round(output_rows / seconds, 1),
+                    "speedup": round(baseline / seconds, 2),
+                    "identical": identical,
+                })
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--datasets", nargs="+", choices=list(TRANSFORMS), default=list(TRANSFORMS))
+    parser.add_argument("--format", choices=STORAGE_FORMATS, default="auto")
+    parser.add_argument("--chunk-size", type=int, default=100000, help="Ukuran potongan untuk input csv")
+    parser.add_argument("--output", help="Append hasil dalam format JSON lines ke file ini")
+    args = parser.parse_args()
+
+    results = run(args.rows, args.processes, args.datasets, resolve_format(args.format), args.chunk_size)
+    for result in results:
+        print(f"{result['dataset']:>11} processes={result['processes']:>2}: {result['rows_per_sec']:>12.1f} rows/sec, "
+              f"speedup {result['speedup']:>5.2f}x, identical={result['identical']}")
+
+    if args.output:
+        with open(args.output, "a", encoding="utf-8") as output_file:
+            for result in results:
+                output_file.write(json.dumps(result) + "\n")
+
+    if not all(result["identical"] for result in results):
+        sys.exit(1)
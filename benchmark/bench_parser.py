@@ -0,0 +1,111 @@
+"""
+Micro-benchmark parser review: mengukur reviews/sec setiap backend parser
+dan memastikan hasilnya identik dengan parser versi awal (BeautifulSoup html.parser).
+
+Contoh menjalankan dari root repository:
+    python -m benchmark.bench_parser --pages 45
+    python -m benchmark.bench_parser --pages-dir /path/ke/halaman/html/tersimpan
+"""
+import argparse
+import glob
+import json
+import os
+import time
+
+from bs4 import BeautifulSoup
+
+from benchmark.fixtures import render_review_page
+from src.helper.review_parser import PARSER_BACKENDS, parse_reviews, resolve_backend
+
+
+def legacy_parse_reviews(html):
+    # Salinan parser awal ExtractMydramalistData.scrape_reviews sebagai baseline
+    soup = BeautifulSoup(html, 'html.parser')
+    reviews_data = []
+
+    for review in soup.find_all('div', class_='review'):
+        reviewer = review.find('a', class_='text-primary').text.strip() if review.find('a', class_='text-primary') else "Unknown"
+        profile_link = review.find('a', class_='text-primary')['href'] if review.find('a', class_='text-primary') else "No Profile Link"
+        review_date = review.find('small', class_='datetime').text.strip() if review.find('small', class_='datetime') else "No Date"
+        helpful_count = review.find('div', class_='user-stats').find('b').text.strip() if review.find('div', class_='user-stats') else "0"
+        overall_rating = review.find('span', class_='score').text.strip() if review.find('span', class_='score') else "0"
+
+        reviews_body = review.find('div', class_='review-body')
+        review_body = reviews_body.text.strip().replace('\n', ' ') if reviews_body else "No Review Available"
+
+        read_more = review.find('p', class_='read-more')
+        if read_more:
+            review_body += " (Full Review Not Available)"
+
+        reviews_data.append({
+            'reviewer': reviewer,
+            'profile_link': profile_link,
+            'review_date': review_date,
+            'helpful_count': helpful_count,
+            'overall_rating': overall_rating,
+            'review_body': review_body
+        })
+
+    return reviews_data
+
+
+def load_pages(pages, pages_dir):
+    if pages_dir:
+        paths = sorted(glob.glob(os.path.join(pages_dir, "*.html")))
+        pages_html = []
+        for path in paths:
+            with open(path, encoding="utf-8") as page_file:
+                pages_html.append(page_file.read())
+        return pages_html
+    return [render_review_page(page) for page in range(1, pages + 1)]
+
+
+def run(pages_html, repeat):
+    parsers = {"legacy": legacy_parse_reviews}
+    for backend in PARSER_BACKENDS[1:]:
+        try:
+            resolve_backend(backend)
+        except ImportError:
+            print(f"Skipping backend {backend}: not installed")
+            continue
+        parsers[backend] = lambda html, backend=backend: parse_reviews(html, backend=backend)
+
+    expected = [legacy_parse_reviews(html) for html in pages_html]
+    results = []
+
+    for name, parser in parsers.items():
+        start_time = time.perf_counter()
+        for _ in range(repeat):
+            parsed = [parser(html) for html in pages_html]
+        elapsed = time.perf_counter() - start_time
+
+        reviews = sum(len(page) for page in parsed) * repeat
+        results.append({
+            "benchmark": "parser",
+            "backend": name,
+            "pages": len(pages_html),
+            "reviews": reviews,
+            "identical": parsed == expected,
+            "seconds": round(elapsed, 4),
+            "reviews_per_sec": round(reviews / elapsed, 1),
+        })
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=45)
+    parser.add_argument("--pages-dir", help="Direktori berisi halaman review tersimpan (*.html)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="Append hasil dalam format JSON lines ke file ini")
+    args = parser.parse_args()
+
+    results = run(load_pages(args.pages, args.pages_dir), args.repeat)
+    for result in results:
+        print(f"{result['backend']:>7}: {result['reviews_per_sec']:>10.1f} reviews/sec, identical={result['identical']}")
+
+    if args.output:
+        with open(args.output, "a", encoding="utf-8") as output_file:
+            for result in results:
+                output_file.write(json.dumps(result) + "\n")
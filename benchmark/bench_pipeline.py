@@ -0,0 +1,205 @@
+"""
+Benchmark end-to-end: menjalankan ETLPipeline lengkap (extract -> validate -> transform -> load) secara offline
+pada data sintetis dengan beberapa skala, lalu mencatat throughput dan peak memory setiap stage dan seluruh pipeline.
+
+Setiap skala memakai direktori sementara (ETL_DATA_DIR), database SQLite sebagai pengganti PostgreSQL
+sumber dan tujuan (atau --source-dsn/--load-dsn untuk PostgreSQL lokal), file CSV product sintetis,
+dan server review lokal sebagai pengganti website MyDramalist. Metric per stage diambil dari run report.
+
+Contoh menjalankan dari root repository:
+    python -m benchmark.bench_pipeline --scales 10000 100000 1000000 --format parquet --output bench_output.txt
+    python -m benchmark.bench_pipeline --scales 10000000 --chunked --chunk-size 500000
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+from benchmark.bench_chunked import in_process
+from benchmark.fixtures import ReviewFixtureServer
+from benchmark.synthetic import amazon_sales_frame, product_pricing_frame
+from src.helper.metrics_helper import peak_memory_with_children_mb
+from src.helper.storage_helper import STORAGE_FORMATS, resolve_format
+
+# Data sintetis dibuat dan ditulis per batch sehingga skala besar tidak perlu dimuat sekaligus
+GENERATE_BATCH_ROWS = 100000
+
+# Task transform yang menerima parameter chunked, chunk_size, dan processes
+TRANSFORM_TASKS = ["TransformAmazonData", "TransformProductData", "TransformMydramalistData"]
+
+
+def generate_sources(rows, source_dsn, product_csv):
+    """
+    Function yang digunakan untuk membuat tabel amazon_sales_data di database sumber
+    dan file CSV product, masing-masing berisi `rows` baris.
+    """
+    from src.helper.db_connector import get_engine
+    from src.helper.load_helper import load_dataframe, supports_copy
+
+    engine = get_engine(source_dsn)
+    method = "copy" if supports_copy(engine) else "insert"
+
+    for batch, start in enumerate(range(0, rows, GENERATE_BATCH_ROWS)):
+        size = min(GENERATE_BATCH_ROWS, rows - start)
+
+        amazon = amazon_sales_frame(size, seed=batch)
+        amazon["Unnamed: 0"] += start
+        load_dataframe(amazon, "amazon_sales_data", engine, if_exists="replace" if batch == 0 else "append",
+                       method=method)
+
+        product = product_pricing_frame(size, seed=batch)
+        product.to_csv(product_csv, mode="w" if batch == 0 else "a", header=batch == 0, index=False)
+
+
+def write_luigi_config(config, path):
+    # Pengaturan ditulis sebagai file luigi.cfg (LUIGI_CONFIG_PATH) dan bukan lewat API,
+    # karena worker Luigi di proses hasil spawn membaca ulang konfigurasi dari file
+    with open(path, "w", encoding="utf-8") as config_file:
+        for section, options in config.items():
+            config_file.write(f"[{section}]\n")
+            config_file.writelines(f"{option}={value}\n" for option, value in options.items())
+            config_file.write("\n")
+
+
+def run_pipeline(workers):
+    """
+    Function yang digunakan untuk menjalankan ETLPipeline di proses ini.
+    Mengembalikan status build, durasi, dan peak memory (termasuk proses worker Luigi).
+    """
+    # etl_pipeline di-import di sini agar ETL_DATA_DIR dan URL database dari proses induk sudah terbaca
+    import luigi
+    from etl_pipeline import ETLPipeline
+
+    start_time = time.perf_counter()
+    success = luigi.build([ETLPipeline()], local_scheduler=True, workers=workers, log_level="WARNING")
+    return success, time.perf_counter() - start_time, peak_memory_with_children_mb()
+
+
+def _stage_label(record):
+    dataset = record.get("params", {}).get("dataset")
+    return f"{record['task_family']}({dataset})" if dataset else record["task_family"]
+
+
+def stage_results(report_path, base):
+    results = []
+    if not os.path.exists(report_path):
+        return results
+    with open(report_path, encoding="utf-8") as report_file:
+        records = [json.loads(line) for line in report_file if line.strip()]
+
+    for record in records:
+        if record["task_family"] == "ETLPipeline":
+            continue
+        rows = record["rows_out"] if record["rows_out"] is not None else record["rows_in"]
+        results.append({
+            **base,
+            "stage": _stage_label(record),
+            "status": record["status"],
+            "rows": rows,
+            "seconds": record["wall_seconds"],
+            "cpu_seconds": record["cpu_seconds"],
+            "rows_per_sec": round(rows / record["wall_seconds"], 1) if rows and record["wall_seconds"] else None,
+            "peak_memory_mb": record["peak_rss_mb"],
+            "bytes_written": record["bytes_written"],
+        })
+    return results
+
+
+def run_scale(rows, args, server):
+    with tempfile.TemporaryDirectory() as directory:
+        data_dir = os.path.join(directory, "data")
+        product_csv = os.path.join(directory, "ElectronicsProductsPricingData.csv")
+        source_dsn = args.source_dsn or f"sqlite:///{os.path.join(directory, 'source.db')}"
+        load_dsn = args.load_dsn or f"sqlite:///{os.path.join(directory, 'load.db')}"
+        report_path = os.path.join(directory, "run_report.jsonl")
+
+        generate_start = time.perf_counter()
+        in_process(generate_sources, rows, source_dsn, product_csv)
+        generate_seconds = time.perf_counter() - generate_start
+
+        transform_options = {"chunked": args.chunked, "chunk_size": args.chunk_size, "processes": args.processes}
+        config = {
+            "StorageConfig": {"format": args.format},
+            "RunReportConfig": {"path": report_path, "run_id": f"bench-{rows}"},
+            "ExtractMydramalistData": {
+                "base_url": server.base_url,
+                "total_pages": args.review_pages,
+                "use_cache": False,
+                "requests_per_second": 0,
+            },
+            **{task: transform_options for task in TRANSFORM_TASKS},
+        }
+        config_path = os.path.join(directory, "luigi.cfg")
+        write_luigi_config(config, config_path)
+
+        # Proses pipeline (spawn) mewarisi environment ini sehingga semua task memakai direktori sementara
+        os.environ.update({
+            "ETL_DATA_DIR": data_dir,
+            "ETL_PRODUCT_CSV": product_csv,
+            "SOURCE_DB_URL": source_dsn,
+            "LOAD_DB_URL": load_dsn,
+            "LUIGI_CONFIG_PATH": config_path,
+        })
+        success, seconds, memory = in_process(run_pipeline, args.workers)
+
+        base = {"benchmark": "pipeline", "scale": rows, "format": args.format, "workers": args.workers,
+                "chunked": args.chunked, "processes": args.processes}
+        results = stage_results(report_path, base)
+
+        # Baris input seluruh pipeline: amazon + product + review hasil scraping
+        input_rows = 2 * rows + args.review_pages * args.reviews_per_page
+        results.append({
+            **base,
+            "stage": "end-to-end",
+            "status": "success" if success else "failure",
+            "rows": input_rows,
+            "seconds": round(seconds, 4),
+            "rows_per_sec": round(input_rows / seconds, 1),
+            # Proses worker Luigi yang belum di-reap belum masuk ke RUSAGE_CHILDREN, sehingga diambil juga dari report
+            "peak_memory_mb": round(max([memory] + [result["peak_memory_mb"] for result in results]), 1),
+            "generate_seconds": round(generate_seconds, 4),
+        })
+        return results
+
+
+def run(args):
+    results = []
+    with ReviewFixtureServer(reviews_per_page=args.reviews_per_page, latency=args.latency) as server:
+        for rows in args.scales:
+            results += run_scale(rows, args, server)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", type=int, nargs="+", default=[10000, 100000],
+                        help="Jumlah baris amazon_sales_data dan CSV product untuk setiap run")
+    parser.add_argument("--review-pages", type=int, default=20)
+    parser.add_argument("--reviews-per-page", type=int, default=12)
+    parser.add_argument("--latency", type=float, default=0.0, help="Latency server review lokal (detik)")
+    parser.add_argument("--format", choices=STORAGE_FORMATS, default="auto")
+    parser.add_argument("--workers", type=int, default=3, help="Jumlah Luigi worker")
+    parser.add_argument("--chunked", action="store_true")
+    parser.add_argument("--chunk-size", type=int, default=100000)
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--source-dsn", help="Database sumber, default SQLite di direktori sementara")
+    parser.add_argument("--load-dsn", help="Database tujuan, default SQLite di direktori sementara")
+    parser.add_argument("--output", help="Append hasil dalam format JSON lines ke file ini")
+    args = parser.parse_args()
+    args.format = resolve_format(args.format)
+
+    results = run(args)
+    for result in results:
+        rows_per_sec = f"{result['rows_per_sec']:>12.1f}" if result["rows_per_sec"] is not None else f"{'-':>12}"
+        print(f"{result['scale']:>9} {result['stage']:<34} {result['status']:>8} {result['rows'] or 0:>10} rows "
+              f"{result['seconds']:>8.2f}s {rows_per_sec} rows/sec, peak memory {result['peak_memory_mb']:>8.1f} MB")
+
+    if args.output:
+        with open(args.output, "a", encoding="utf-8") as output_file:
+            for result in results:
+                output_file.write(json.dumps(result) + "\n")
+
+    if not all(result["status"] == "success" for result in results):
+        sys.exit(1)
@@ -0,0 +1,95 @@
+"""
+Benchmark ekstraksi rating TransformMydramalistData: membandingkan loop re.search per baris
+(implementasi awal) dengan extract_ratings (satu pattern ter-anchor per review), pada korpus review sintetis,
+dan memastikan hasil keduanya sama persis.
+
+Contoh menjalankan dari root repository:
+    python -m benchmark.bench_ratings --rows 1000000
+"""
+import argparse
+import json
+import re
+import time
+
+import pandas as pd
+
+from benchmark.synthetic import review_bodies
+from src.helper.transform_helper import extract_ratings
+
+
+def legacy_extract_ratings(review_body):
+    # Salinan implementasi awal TransformMydramalistData.run sebagai baseline
+    overall_ratings = []
+    story_ratings = []
+    acting_ratings = []
+    music_ratings = []
+    rewatch_value_ratings = []
+    reviews = []
+
+    for body in review_body:
+        overall = re.search(r'Overall\s*(\d+(\.\d+)?)', body, re.IGNORECASE)
+        story = re.search(r'Story\s*(\d+(\.\d+)?)', body, re.IGNORECASE)
+        acting_cast = re.search(r'Acting/Cast\s*(\d+(\.\d+)?)', body, re.IGNORECASE)
+        music = re.search(r'Music\s*(\d+(\.\d+)?)', body, re.IGNORECASE)
+        rewatch_value = re.search(r'Rewatch Value\s*(\d+(\.\d+)?)', body, re.IGNORECASE)
+
+        overall_ratings.append(overall.group(1) if overall else "0")
+        story_ratings.append(story.group(1) if story else "0")
+        acting_ratings.append(acting_cast.group(1) if acting_cast else "0")
+        music_ratings.append(music.group(1) if music else "0")
+        rewatch_value_ratings.append(rewatch_value.group(1) if rewatch_value else "0")
+
+        review_text = re.split(r'Overall\s*\d+(\.\d+)?|Story\s*\d+(\.\d+)?|Acting/Cast\s*\d+(\.\d+)?|Music\s*\d+(\.\d+)?|Rewatch Value\s*\d+(\.\d+)?', body)
+        reviews.append(review_text[-1].strip())
+
+    ratings = pd.DataFrame({
+        'overall_rating': overall_ratings,
+        'story_rating': story_ratings,
+        'acting_rating': acting_ratings,
+        'music_rating': music_ratings,
+        'rewatch_value': rewatch_value_ratings,
+    }, index=review_body.index)
+    for col in ratings.columns:
+        ratings[col] = pd.to_numeric(ratings[col], errors='coerce').fillna(0).astype(float)
+    ratings['reviews'] = reviews
+    return ratings
+
+
+def run(rows):
+    review_body = pd.Series(review_bodies(rows))
+    results = []
+    outputs = {}
+
+    for name, extract in [("legacy", legacy_extract_ratings), ("single-pass", extract_ratings)]:
+        start_time = time.perf_counter()
+        outputs[name] = extract(review_body)
+        elapsed = time.perf_counter() - start_time
+        results.append({
+            "benchmark": "ratings",
+            "implementation": name,
+            "rows": rows,
+            "seconds": round(elapsed, 4),
+            "rows_per_sec": round(rows / elapsed, 1),
+        })
+
+    identical = outputs["legacy"].equals(outputs["single-pass"])
+    for result in results:
+        result["identical"] = identical
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--output", help="Append hasil dalam format JSON lines ke file ini")
+    args = parser.parse_args()
+
+    results = run(args.rows)
+    for result in results:
+        print(f"{result['implementation']:>11}: {result['seconds']:>8.2f}s, {result['rows_per_sec']:>12.1f} rows/sec, "
+              f"identical={result['identical']}")
+
+    if args.output:
+        with open(args.output, "a", encoding="utf-8") as output_file:
+            for result in results:
+                output_file.write(json.dumps(result) + "\n")
@@ -0,0 +1,80 @@
+"""
+Benchmark scraper: mengukur pages/sec ExtractMydramalistData terhadap server review lokal.
+
+Contoh menjalankan dari root repository:
+    python -m benchmark.bench_scraper --pages 45 --latency 0.2 --workers 1 8
+
+Selain perbandingan jumlah worker, benchmark juga menjalankan crawl dengan cache
+(cold lalu warm/revalidasi) dan mencatat jumlah request yang benar-benar sampai ke server.
+"""
+import argparse
+import json
+import tempfile
+import time
+
+from benchmark.fixtures import ReviewFixtureServer
+from etl_pipeline import ExtractMydramalistData
+
+
+def crawl(server, pages, latency, workers, mode, **task_params):
+    task = ExtractMydramalistData(
+        total_pages=pages,
+        base_url=server.base_url,
+        max_workers=workers,
+        requests_per_second=0,
+        **task_params,
+    )
+    urls = [task.page_url(page) for page in range(1, pages + 1)]
+    requests_before = server.request_count
+
+    start_time = time.perf_counter()
+    with task.create_fetcher() as fetcher:
+        parsed_pages = fetcher.fetch_all(urls, task.parse_reviews, stop_when_unchanged=task.stop_when_unchanged)
+    elapsed = time.perf_counter() - start_time
+
+    return {
+        "benchmark": "scraper",
+        "mode": mode,
+        "workers": workers,
+        "pages": pages,
+        "requests": server.request_count - requests_before,
+        "reviews": sum(len(reviews) for reviews in parsed_pages),
+        "latency": latency,
+        "seconds": round(elapsed, 4),
+        "pages_per_sec": round(pages / elapsed, 1),
+    }
+
+
+def run(pages, latency, workers_list):
+    results = []
+
+    with ReviewFixtureServer(latency=latency) as server:
+        for workers in workers_list:
+            results.append(crawl(server, pages, latency, workers, "no-cache", use_cache=False))
+
+        # cache_ttl=0 memaksa revalidasi, sehingga warm crawl mengukur ETag + early stop
+        with tempfile.TemporaryDirectory() as cache_dir:
+            for mode in ["cache-cold", "cache-warm"]:
+                results.append(crawl(server, pages, latency, max(workers_list), mode,
+                                     cache_dir=cache_dir, cache_ttl=0))
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=45)
+    parser.add_argument("--latency", type=float, default=0.2, help="Simulasi round trip per request (detik)")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 8])
+    parser.add_argument("--output", help="Append hasil dalam format JSON lines ke file ini")
+    args = parser.parse_args()
+
+    results = run(args.pages, args.latency, args.workers)
+    for result in results:
+        print(f"{result['mode']:>10} workers={result['workers']:>3}: {result['pages_per_sec']:>8.1f} pages/sec, "
+              f"{result['requests']} requests ({result['reviews']} reviews)")
+
+    if args.output:
+        with open(args.output, "a", encoding="utf-8") as output_file:
+            for result in results:
+                output_file.write(json.dumps(result) + "\n")
@@ -0,0 +1,102 @@
+"""
+Benchmark format penyimpanan antar stage: mengukur waktu tulis/baca dan ukuran file
+CSV, Parquet, dan Arrow IPC untuk setiap dataset, dengan jumlah boundary yang sama seperti pipeline
+(raw -> validate -> transform -> load), serta memeriksa apakah tipe data tetap sama setelah dibaca ulang.
+
+Contoh menjalankan dari root repository:
+    python -m benchmark.bench_storage --rows 200000
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmark.synthetic import amazon_sales_frame, product_pricing_frame, review_bodies
+from src.helper.storage_helper import STORAGE_FORMATS, read_frame, resolve_format, write_frame
+from src.helper.transform_helper import PRODUCT_NORMALIZATION_RULES, normalize_categorical
+
+# Jumlah boundary antar stage untuk setiap dataset
+STAGE_BOUNDARIES = 4
+
+
+def transformed_product_frame(rows):
+    # Data product setelah transformasi: kolom category dan datetime
+    data = product_pricing_frame(rows).rename(columns={
+        'prices.availability': 'Availability', 'prices.condition': 'Condition',
+        'prices.isSale': 'isSale', 'prices.shipping': 'Shipping',
+    })
+    for col, rule in PRODUCT_NORMALIZATION_RULES.items():
+        data[col] = normalize_categorical(data[col], rule)
+    for col in ['dateAdded', 'dateUpdated', 'prices.dateSeen']:
+        data[col] = pd.to_datetime(data[col], errors='coerce').bfill()
+    return data
+
+
+def datasets(rows):
+    return {
+        "amazon": amazon_sales_frame(rows),
+        "product": transformed_product_frame(rows),
+        "mydramalist": pd.DataFrame({"review_body": review_bodies(max(rows // 10, 1))}),
+    }
+
+
+def measure(data, storage_format, directory):
+    path = os.path.join(directory, f"data.{storage_format}")
+    write_seconds = read_seconds = 0.0
+
+    for _ in range(STAGE_BOUNDARIES):
+        start_time = time.perf_counter()
+        write_frame(data, path, storage_format)
+        write_seconds += time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        loaded = read_frame(path, storage_format)
+        read_seconds += time.perf_counter() - start_time
+
+    return {
+        "write_seconds": round(write_seconds, 4),
+        "read_seconds": round(read_seconds, 4),
+        "seconds": round(write_seconds + read_seconds, 4),
+        "size_mb": round(os.path.getsize(path) / 1024 ** 2, 2),
+        "dtypes_preserved": loaded.dtypes.equals(data.dtypes),
+    }
+
+
+def run(rows, formats):
+    results = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name, data in datasets(rows).items():
+            for storage_format in formats:
+                results.append({
+                    "benchmark": "storage",
+                    "dataset": name,
+                    "format": storage_format,
+                    "rows": len(data),
+                    "boundaries": STAGE_BOUNDARIES,
+                    **measure(data, storage_format, directory),
+                })
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--formats", nargs="+", choices=STORAGE_FORMATS[1:], default=STORAGE_FORMATS[1:])
+    parser.add_argument("--output", help="Append hasil dalam format JSON lines ke file ini")
+    args = parser.parse_args()
+
+    results = run(args.rows, [resolve_format(storage_format) for storage_format in args.formats])
+    for result in results:
+        print(f"{result['dataset']:>11} {result['format']:>7}: write {result['write_seconds']:>7.2f}s, "
+              f"read {result['read_seconds']:>7.2f}s, {result['size_mb']:>8.2f} MB, "
+              f"dtypes_preserved={result['dtypes_preserved']}")
+
+    if args.output:
+        with open(args.output, "a", encoding="utf-8") as output_file:
+            for result in results:
+                output_file.write(json.dumps(result) + "\n")
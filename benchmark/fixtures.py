@@ -0,0 +1,113 @@
+import hashlib
+import html
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+REVIEWS_PATH = "/18452-goblin/reviews"
+
+
+def render_review(page, idx):
+    """
+    Membuat satu elemen review dengan struktur HTML yang sama seperti halaman MyDramalist.
+    """
+    reviewer = f"reviewer_{page}_{idx}"
+    overall = (page + idx) % 10 + 1
+    read_more = '<p class="read-more">Read More</p>' if idx % 4 == 0 else ""
+    body = html.escape(
+        f"Overall {overall}    Story {overall - 0.5 if overall > 1 else 1} Acting/Cast 9 Music 8.5 Rewatch Value 7      "
+        f"Review number {idx} on page {page}. Goblin is a great drama & the cast shines."
+    )
+    return f"""
+<div class="review">
+  <div class="user-stats"><b>{(page * 7 + idx) % 500}</b> people found this review helpful</div>
+  <a class="text-primary" href="/profile/{reviewer}">{reviewer}</a>
+  <small class="datetime">Jan {idx % 28 + 1}, 2017</small>
+  <span class="score">{overall}</span>
+  <div class="review-body">
+    {body}
+  </div>
+  {read_more}
+</div>"""
+
+
+def render_review_page(page, reviews_per_page=12):
+    """
+    Membuat satu halaman review lengkap (canned page) untuk pengujian scraper secara offline.
+    """
+    reviews = "".join(render_review(page, idx) for idx in range(reviews_per_page))
+    return f"""<!DOCTYPE html>
+<html><head><title>Goblin - Reviews page {page}</title></head>
+<body><div class="container"><div class="box">{reviews}</div></div></body></html>"""
+
+
+class _ReviewHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        if parsed.path != REVIEWS_PATH:
+            self.send_error(404)
+            return
+
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        with self.server.lock:
+            self.server.request_count += 1
+
+        page = int(parse_qs(parsed.query).get("page", ["1"])[0])
+        body = render_review_page(page, self.server.reviews_per_page).encode("utf-8")
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+
+        # Mendukung conditional request seperti web server pada umumnya
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ReviewFixtureServer:
+    """
+    HTTP server lokal yang menyajikan halaman review sintetis, dipakai sebagai
+    pengganti website MyDramalist saat benchmark. `latency` mensimulasikan round trip jaringan.
+    Setiap halaman dikirim dengan ETag sehingga request dengan If-None-Match dibalas 304.
+    """
+
+    def __init__(self, reviews_per_page=12, latency=0.0):
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), _ReviewHandler)
+        self.httpd.reviews_per_page = reviews_per_page
+        self.httpd.latency = latency
+        self.httpd.request_count = 0
+        self.httpd.lock = threading.Lock()
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def request_count(self):
+        return self.httpd.request_count
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address
+        return f"http://{host}:{port}{REVIEWS_PATH}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.httpd.shutdown()
+        self.httpd.server_close()
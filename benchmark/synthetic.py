@@ -0,0 +1,146 @@
+import numpy as np
+import pandas as pd
+
+# Nilai-nilai contoh untuk membuat data sintetis yang mirip dengan data asli
+MAIN_CATEGORIES = ["appliances", "car & motorbike", "tv, audio & cameras", "sports & fitness", "grocery & gourmet foods"]
+SUB_CATEGORIES = ["Air Conditioners", "All Appliances", "Cameras", "Cardio Equipment", "Coffee, Tea & Beverages"]
+
+
+def _price_strings(rng, rows, missing_ratio=0.05):
+    prices = rng.integers(99, 150000, size=rows)
+    values = pd.Series([f"₹{price:,}" for price in prices], dtype=object)
+    values[rng.random(rows) < missing_ratio] = np.nan
+    return values
+
+
+def amazon_sales_frame(rows, seed=0):
+    """
+    Function yang digunakan untuk membuat data sintetis dengan bentuk yang sama
+    seperti tabel amazon_sales_data (harga dengan simbol ₹, ribuan dengan koma, dll).
+    """
+    rng = np.random.default_rng(seed)
+
+    ratings = pd.Series(np.round(rng.uniform(1, 5, size=rows), 1).astype(str), dtype=object)
+    noise = rng.random(rows)
+    ratings[noise < 0.02] = "Get"
+    ratings[(noise >= 0.02) & (noise < 0.03)] = "FREE"
+    ratings[(noise >= 0.03) & (noise < 0.08)] = np.nan
+
+    no_of_ratings = pd.Series([f"{count:,}" for count in rng.integers(1, 500000, size=rows)], dtype=object)
+    no_of_ratings[rng.random(rows) < 0.05] = np.nan
+
+    return pd.DataFrame({
+        "Unnamed: 0": np.arange(rows),
+        "name": [f"Product {idx}" for idx in range(rows)],
+        "main_category": rng.choice(MAIN_CATEGORIES, size=rows),
+        "sub_category": rng.choice(SUB_CATEGORIES, size=rows),
+        "image": [f"https://m.media-amazon.com/images/I/{idx}.jpg" for idx in range(rows)],
+        "link": [f"https://www.amazon.in/dp/{idx:010d}" for idx in range(rows)],
+        "ratings": ratings,
+        "no_of_ratings": no_of_ratings,
+        "discount_price": _price_strings(rng, rows),
+        "actual_price": _price_strings(rng, rows),
+    })
+
+
+# Potongan teks untuk membuat review sintetis, termasuk variasi yang jarang muncul
+REVIEW_SENTENCES = [
+    "Goblin is a great drama.",
+    "The music in this show is unforgettable.",
+    "I rewatched it twice and the story still holds up.",
+    "The acting/cast chemistry was amazing.",
+    "Not my favourite, the ending felt rushed.",
+]
+
+
+def review_bodies(rows, seed=0):
+    """
+    Function yang digunakan untuk membuat review_body sintetis dengan format seperti hasil scraping
+    MyDramalist, termasuk rating yang hilang, rating desimal, huruf kecil, dan review tanpa rating.
+    """
+    rng = np.random.default_rng(seed)
+    scores = np.round(rng.integers(2, 21, size=(rows, 5)) / 2, 1)
+    variants = rng.integers(0, 10, size=rows)
+    sentences = rng.integers(0, len(REVIEW_SENTENCES), size=rows)
+    bodies = []
+
+    for idx in range(rows):
+        overall, story, acting, music, rewatch = (f"{score:g}" for score in scores[idx])
+        # Panjang review asli rata-rata sekitar 1.500 karakter
+        text = " ".join([REVIEW_SENTENCES[sentences[idx]]] * 30)
+        variant = variants[idx]
+
+        if variant == 0:
+            body = "No Review Available"
+        elif variant == 9:
+            body = f"No ratings here, just {text}"
+        elif variant == 1:
+            body = f"overall {overall} story {story} Music {music}      {text}"
+        elif variant == 2:
+            body = f"Overall {overall}    Story {story} Acting/Cast {acting} Music {music}      {text} Story 3 again"
+        else:
+            body = (f"Overall {overall}    Story {story} Acting/Cast {acting} Music {music} "
+                    f"Rewatch Value {rewatch}      {text}")
+        bodies.append(body)
+
+    return bodies
+
+
+# Nilai mentah kolom prices.* pada ElectronicsProductsPricingData
+AVAILABILITY_VALUES = ["In Stock", "Yes", "TRUE", "undefined", "yes", "Out Of Stock", "Special Order", "No",
+                       "More on the Way", "sold", "FALSE", "Retired", "32 available", "7 available"]
+CONDITION_VALUES = ["New", "new", "Seller refurbished", "Used", "pre-owned", "Refurbished",
+                    "Manufacturer refurbished", "New other (see details)"]
+SHIPPING_VALUES = ["Expedited", "Value", "Standard", "Free Shipping on orders 35 and up", "Free Expedited Shipping",
+                   "Free Expedited Shipping for most orders over $49", "FREE", "Freight",
+                   "Free Shipping for this Item", "Free Standard Shipping on Orders Over $49", "Free Delivery",
+                   "Free Standard Shipping", "Shipping Charges Apply", "Free Next Day Delivery (USA)",
+                   "USD 25.00 shipping", "CAD 10.99", "Freeshipping"]
+MERCHANTS = ["Bestbuy.com", "bhphotovideo.com", "Walmart.com", "Beach Camera", "AMI Ventures Inc", "buydig"]
+BRANDS = ["Sony", "Samsung", "Apple", "Sanus", "Boytone", "Logitech", "JBL", "Canon"]
+
+
+def _with_missing(rng, values, missing_ratio):
+    values = pd.Series(values, dtype=object)
+    values[rng.random(len(values)) < missing_ratio] = np.nan
+    return values
+
+
+def _timestamps(rng, rows, start, end, missing_ratio=0.0):
+    seconds = rng.integers(pd.Timestamp(start).value // 10**9, pd.Timestamp(end).value // 10**9, size=rows)
+    values = pd.to_datetime(seconds, unit="s", utc=True).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return _with_missing(rng, values, missing_ratio)
+
+
+def product_pricing_frame(rows, seed=0):
+    """
+    Function yang digunakan untuk membuat data sintetis dengan kolom seperti file
+    ElectronicsProductsPricingData.csv, termasuk nilai kosong pada kolom yang perlu di-backfill.
+    """
+    rng = np.random.default_rng(seed)
+    max_price = np.round(rng.uniform(5, 2500, size=rows), 2)
+
+    return pd.DataFrame({
+        "id": [f"AV{idx:018d}" for idx in rng.integers(0, max(rows // 5, 1), size=rows)],
+        "prices.amountMax": max_price,
+        "prices.amountMin": np.round(max_price * rng.uniform(0.7, 1.0, size=rows), 2),
+        "prices.availability": _with_missing(rng, rng.choice(AVAILABILITY_VALUES, size=rows), 0.05),
+        "prices.condition": _with_missing(rng, rng.choice(CONDITION_VALUES, size=rows), 0.02),
+        "prices.currency": "USD",
+        "prices.dateSeen": _timestamps(rng, rows, "2017-01-01", "2018-06-01", 0.01),
+        "prices.isSale": rng.random(rows) < 0.25,
+        "prices.merchant": rng.choice(MERCHANTS, size=rows),
+        "prices.shipping": _with_missing(rng, rng.choice(SHIPPING_VALUES, size=rows), 0.2),
+        "prices.sourceURLs": [f"https://www.example.com/product/{idx}" for idx in range(rows)],
+        "asins": [f"B0{idx:08d}" for idx in range(rows)],
+        "brand": rng.choice(BRANDS, size=rows),
+        "categories": rng.choice(["Electronics,TV Mounts", "Audio,Speakers,Electronics", "Cameras,Accessories"],
+                                 size=rows),
+        "dateAdded": _timestamps(rng, rows, "2014-01-01", "2017-01-01", 0.01),
+        "dateUpdated": _timestamps(rng, rows, "2017-01-01", "2018-06-01", 0.01),
+        "manufacturer": _with_missing(rng, rng.choice(BRANDS, size=rows), 0.5),
+        "name": [f"Electronics product {idx}" for idx in range(rows)],
+        "primaryCategories": rng.choice(["Electronics", "Electronics,Furniture", "Apple CarPlay"], size=rows,
+                                        p=[0.96, 0.02, 0.02]),
+        "weight": rng.choice(["1.5 lbs", "12 pounds", "300 g"], size=rows),
+    })
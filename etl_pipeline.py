@@ -1,227 +1,438 @@
 import pandas as pd
-import numpy as np
 import luigi
-import re
 import csv
-from src.helper.db_connector import postgres_amazon_engine, postgres_load_engine
-import requests
-from bs4 import BeautifulSoup
-from tqdm import tqdm
+import json
+import math
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from sqlalchemy import MetaData, Table, text
+from src.helper.db_connector import postgres_amazon_engine, postgres_load_engine, report_engine_stats
+from src.helper.metrics_helper import ThroughputMeter
+from src.helper.load_helper import LOAD_METHODS, LOAD_MODES, load_dataframe, upsert_dataframe
+from src.helper.watermark_helper import (
+    read_watermark, stage_watermark, commit_watermark, has_pending_watermark, is_pending_full_extract
+)
+from src.helper.fetch_helper import PageFetcher
+from src.helper.http_cache import ResponseCache
+from src.helper.fingerprint_helper import FingerprintTask, file_digest
+from src.helper.quality_helper import build_report, check_thresholds, profile_chunks, profile_frame
+from src.helper.run_report import register_task_metrics
+from src.helper.review_parser import PARSER_BACKENDS, parse_reviews as parse_review_html
+from src.helper.storage_helper import STORAGE_FORMATS, DataFrameTarget, read_frame, read_range, write_frame
+from src.helper.transform_helper import (
+    NUMERIC_ENGINES, PRODUCT_NORMALIZATION_RULES, clean_numeric, extract_ratings, normalize_categorical,
+    transform_in_chunks
+)
+
+# Direktori data pipeline (raw, validate, transform, load, cache) dan file CSV product,
+# dapat diarahkan ke lokasi lain melalui environment (misalnya saat benchmark)
+DATA_DIR = os.getenv("ETL_DATA_DIR", "/Users/user/data-eng/data")
+PRODUCT_CSV_FILE = os.getenv("ETL_PRODUCT_CSV", "/Users/user/Downloads/ElectronicsProductsPricingData.csv")
+
+# Format penyimpanan data antar stage (raw -> transform -> load), diatur per run
+# melalui section [StorageConfig] pada luigi.cfg atau --StorageConfig-format di command line
+class StorageConfig(luigi.Config):
+    format = luigi.ChoiceParameter(choices=STORAGE_FORMATS, default="auto")  # parquet, arrow, csv, atau auto
+    export_csv = luigi.BoolParameter(default=False)  # Menulis salinan CSV di samping file parquet/arrow
+
+def data_target(path, **csv_options):
+    config = StorageConfig()
+    return DataFrameTarget(path, config.format, export_csv=config.export_csv, **csv_options)
+
+# Wall time, CPU time, peak RSS, jumlah baris, dan ukuran file setiap task dicatat ke run report,
+# diatur melalui section [RunReportConfig] pada luigi.cfg
+register_task_metrics()
+
+# Dataset yang diproses pipeline, masing-masing memiliki branch validate -> transform -> load sendiri
+DATASETS = ["amazon", "product", "mydramalist"]
 
 # Proses Extract Amazon Data
-class ExtractAmazonData(luigi.Task):
+class ExtractAmazonData(FingerprintTask):
+    stream = luigi.BoolParameter(default=True, significant=False)  # Streaming extract dengan server-side cursor
+    chunk_size = luigi.IntParameter(default=50000, significant=False)  # Jumlah baris per batch saat streaming
+    incremental = luigi.BoolParameter(default=False)  # Hanya mengambil baris setelah watermark terakhir
+    watermark_column = luigi.Parameter(default="Unnamed: 0")  # Kolom key/timestamp yang selalu naik
+
+    source_table = "amazon_sales_data"
+
     def requires(self):
         pass 
 
-    def run(self):
-        # Inisialisasi engine Postgres
-        engine = postgres_amazon_engine()
-
+    def build_query(self, engine):
         # Query untuk mengambil data dari tabel amazon_sales_data
-        query = "SELECT * FROM amazon_sales_data"
-
-        # Membaca data dari sql
-        amazon_data = pd.read_sql(sql=query, con=engine)
+        query = f"SELECT * FROM {self.source_table}"
+        params = {}
+
+        if self.incremental:
+            column = engine.dialect.identifier_preparer.quote(self.watermark_column)
+            watermark = read_watermark(self.source_table, self.watermark_column)
+
+            # Hanya mengambil baris setelah watermark terakhir yang sudah di-load
+            if watermark is not None:
+                query += f" WHERE {column} > :watermark"
+                params["watermark"] = watermark
+            query += f" ORDER BY {column}"
+
+        return text(query), params
+
+    def column_types(self, conn):
+        # Tipe Python setiap kolom tabel sumber, dipakai untuk schema file jika sebuah kolom
+        # kosong di seluruh batch pertama sehingga tipenya tidak bisa ditebak dari data
+        types = {}
+        for column in Table(self.source_table, MetaData(), autoload_with=conn).columns:
+            try:
+                types[column.name] = column.type.python_type
+            except NotImplementedError:
+                continue
+        return types
+
+    def source_fingerprint(self):
+        # Nilai terbesar kolom watermark dan penanda perubahan tabel sumber, sehingga extract hanya dijalankan
+        # ulang jika tabel berubah. PostgreSQL memakai counter insert/update/delete pada pg_stat_user_tables
+        # tanpa scan tabel, database lain memakai COUNT(*)
+        engine = postgres_amazon_engine()
+        column = engine.dialect.identifier_preparer.quote(self.watermark_column)
+        with engine.connect() as conn:
+            max_value = conn.execute(text(f"SELECT MAX({column}) FROM {self.source_table}")).scalar()
+            changes = None
+            if engine.dialect.name == "postgresql":
+                changes = conn.execute(
+                    text("SELECT n_tup_ins, n_tup_upd, n_tup_del FROM pg_stat_user_tables WHERE relname = :table"),
+                    {"table": self.source_table},
+                ).first()
+            if changes is None:
+                changes = conn.execute(text(f"SELECT COUNT(*) FROM {self.source_table}")).one()
+        return [max_value, list(changes)]
 
-        # Menyimpan dalam bentuk CSV
-        amazon_data.to_csv(self.output().path, index=False)
+    def run(self):
+        # Engine Postgres (dipakai ulang dari pool per proses)
+        engine = postgres_amazon_engine()
+        query, params = self.build_query(engine)
+        max_watermark = None
+
+        if not self.stream:
+            # Membaca data dari sql
+            with engine.connect() as conn:
+                amazon_data = pd.read_sql(sql=query, con=conn, params=params)
+
+            if self.incremental and not amazon_data.empty:
+                max_watermark = amazon_data[self.watermark_column].max()
+
+            # Menyimpan sesuai format penyimpanan antar stage
+            self.output().write(amazon_data)
+        else:
+            meter = ThroughputMeter("ExtractAmazonData")
+
+            # yield_per membuat psycopg2 memakai named (server-side) cursor,
+            # sehingga hanya satu batch yang berada di memory pada satu waktu.
+            # File ditulis ke temporary path dan baru di-rename ketika selesai
+            output = self.output()
+            output.makedirs()
+            with engine.connect() as conn:
+                column_types = self.column_types(conn)
+            with engine.connect().execution_options(yield_per=self.chunk_size) as conn, \
+                    output.temporary_path() as temp_path, \
+                    output.writer(temp_path, column_types=column_types) as writer:
+                result = conn.execute(query, params)
+                columns = list(result.keys())
+
+                for rows in result.partitions(self.chunk_size):
+                    batch = pd.DataFrame(rows, columns=columns)
+                    writer.write(batch)
+                    meter.add(len(batch))
+
+                    if self.incremental:
+                        max_watermark = batch[self.watermark_column].max()
+
+                # Tetap menulis header/schema walaupun tabel kosong
+                if writer.rows == 0:
+                    writer.write(pd.DataFrame(columns=columns))
+
+            meter.report()
+
+        # Watermark baru disimpan sebagai pending dan di-commit oleh LoadData.
+        # Tanpa watermark sebelumnya query mengambil seluruh tabel, sehingga ditandai sebagai extract penuh
+        if max_watermark is not None:
+            stage_watermark(self.source_table, self.watermark_column, max_watermark,
+                            full_extract="watermark" not in params)
+
+        report_engine_stats(engine, "ExtractAmazonData")
 
     def output(self):
-        return luigi.LocalTarget("/Users/user/data-eng/data/raw/extract_amazon_data.csv")
+        return data_target(f"{DATA_DIR}/raw/extract_amazon_data.csv")
 
  # Proses Extract Product Data   
-class ExtractProductData(luigi.Task):
-    csv_file = luigi.Parameter(default="/Users/user/Downloads/ElectronicsProductsPricingData.csv")
+class ExtractProductData(FingerprintTask):
+    csv_file = luigi.Parameter(default=PRODUCT_CSV_FILE)
+
+    def source_fingerprint(self):
+        # Hash isi file CSV sumber
+        return file_digest(self.csv_file)
 
     def run(self):
         # Membaca data dari file CSV
         product_data = pd.read_csv(self.csv_file)
 
-        # Menyimpan ke CSV
-        product_data.to_csv(self.output().path, index=False)
+        # Kolom kosong tanpa nama (koma berlebih di akhir baris CSV) tidak ikut disimpan
+        empty_columns = [
+            col for col in product_data.columns if col.startswith("Unnamed:") and product_data[col].isna().all()
+        ]
+        product_data = product_data.drop(columns=empty_columns)
+
+        # Menyimpan sesuai format penyimpanan antar stage
+        self.output().write(product_data)
     
     def output(self):
-        return luigi.LocalTarget("/Users/user/data-eng/data/raw/extract_product_data.csv")
+        return data_target(f"{DATA_DIR}/raw/extract_product_data.csv")
 
 # Proses Extract Mydramalist Data 
-class ExtractMydramalistData(luigi.Task):
+class ExtractMydramalistData(FingerprintTask):
     total_pages = luigi.IntParameter(default=45)  # Total halaman yang akan discrape 
+    base_url = luigi.Parameter(default="https://mydramalist.com/18452-goblin/reviews")  # Bisa diarahkan ke server lokal
+    max_workers = luigi.IntParameter(default=8, significant=False)  # Jumlah request yang berjalan bersamaan
+    requests_per_second = luigi.FloatParameter(default=5.0, significant=False)  # Rate limit per host
+    timeout = luigi.FloatParameter(default=10.0, significant=False)  # Timeout setiap request (detik)
+    retries = luigi.IntParameter(default=3, significant=False)  # Jumlah retry dengan exponential backoff
+    use_cache = luigi.BoolParameter(default=True, significant=False)  # Menyimpan halaman di disk dan merevalidasi dengan ETag/Last-Modified
+    cache_dir = luigi.Parameter(default=f"{DATA_DIR}/cache/mydramalist", significant=False)
+    cache_ttl = luigi.FloatParameter(default=12 * 3600, significant=False)  # Umur halaman di cache sebelum direvalidasi (detik)
+    cache_max_mb = luigi.IntParameter(default=100, significant=False)  # Batas ukuran cache, entry terlama dihapus (LRU)
+    stop_when_unchanged = luigi.BoolParameter(default=True, significant=False)  # Berhenti request setelah ada halaman yang tidak berubah
+    parser_backend = luigi.ChoiceParameter(choices=PARSER_BACKENDS, default="auto", significant=False)  # lxml, soup, atau auto
+
+    code_dependencies = ("src.helper.review_parser",)
+
+    def page_url(self, page):
+        return f"{self.base_url}?page={page}"
+
+    def create_fetcher(self):
+        cache = None
+        if self.use_cache:
+            cache = ResponseCache(self.cache_dir, ttl=self.cache_ttl, max_bytes=self.cache_max_mb * 1024 * 1024)
+
+        return PageFetcher(
+            max_workers=self.max_workers,
+            requests_per_second=self.requests_per_second,
+            timeout=self.timeout,
+            retries=self.retries,
+            cache=cache,
+        )
 
-    # Fungsi untuk mengambil data review
+    # Fungsi untuk mengambil data review dari satu halaman
     def scrape_reviews(self, page):
-        url = f'https://mydramalist.com/18452-goblin/reviews?page={page}'
-        response = requests.get(url)  
-        soup = BeautifulSoup(response.text, 'html.parser') 
-        reviews_data = [] 
-
-        # Mengambil elemen ulasan
-        for review in soup.find_all('div', class_='review'):
-            # Mengambil informasi reviewer
-            reviewer = review.find('a', class_='text-primary').text.strip() if review.find('a', class_='text-primary') else "Unknown"
-            profile_link = review.find('a', class_='text-primary')['href'] if review.find('a', class_='text-primary') else "No Profile Link"
-            review_date = review.find('small', class_='datetime').text.strip() if review.find('small', class_='datetime') else "No Date"
-            helpful_count = review.find('div', class_='user-stats').find('b').text.strip() if review.find('div', class_='user-stats') else "0"
-            overall_rating = review.find('span', class_='score').text.strip() if review.find('span', class_='score') else "0"
-
-            # Mengambil isi review
-            reviews_body = review.find('div', class_='review-body')
-            review_body = reviews_body.text.strip().replace('\n', ' ') if reviews_body else "No Review Available"
-
-            # Mengambil review yang dipotong dengan "Read More"
-            read_more = review.find('p', class_='read-more')
-            if read_more:
-                review_body += " (Full Review Not Available)"
-
-            # Menyimpan data review ke dalam daftar
-            reviews_data.append({
-                'reviewer': reviewer,
-                'profile_link': profile_link,
-                'review_date': review_date,
-                'helpful_count': helpful_count,
-                'overall_rating': overall_rating,
-                'review_body': review_body 
-            })
-
-        return reviews_data  # Mengembalikan data review
+        with self.create_fetcher() as fetcher:
+            fetched_page = fetcher.fetch(self.page_url(page))
+        return self.parse_reviews(fetched_page)
+
+    # Fungsi untuk mem-parsing data review dari halaman yang sudah diambil
+    def parse_reviews(self, page):
+        return parse_review_html(page.text, backend=self.parser_backend)
 
     def output(self):
-        return luigi.LocalTarget('/Users/user/data-eng/data/raw/extract_mydramalist_data.csv')  
+        return data_target(f'{DATA_DIR}/raw/extract_mydramalist_data.csv', encoding='utf-8',
+                           quoting=csv.QUOTE_NONNUMERIC)
     
     def run(self):
         all_reviews = []  
-        
-        # Mengambil review dari beberapa halaman dengan progress bar
-        for page in tqdm(range(1, self.total_pages + 1), desc="Scraping Pages"):
-            reviews_on_page = self.scrape_reviews(page)  
+        urls = [self.page_url(page) for page in range(1, self.total_pages + 1)]
+
+        # Mengambil review dari beberapa halaman secara concurrent dengan progress bar
+        with self.create_fetcher() as fetcher:
+            pages = fetcher.fetch_all(urls, self.parse_reviews, desc="Scraping Pages",
+                                      stop_when_unchanged=self.stop_when_unchanged)
+
+        for reviews_on_page in pages:
             all_reviews.extend(reviews_on_page)  
 
         # Mengonversi data menjadi DataFrame
         goblin_reviews = pd.DataFrame(all_reviews)
 
-        # Menyimpan DataFrame ke file CSV
-        goblin_reviews.to_csv(self.output().path, index=False, encoding='utf-8', quoting=csv.QUOTE_NONNUMERIC)
+        # Menyimpan DataFrame sesuai format penyimpanan antar stage
+        self.output().write(goblin_reviews)
 
 
-# Proses validasi data untuk setiap dataset
-class ValidateData(luigi.Task):
+# Proses validasi data, satu task untuk setiap dataset sehingga
+# setiap branch (extract -> validate -> transform -> load) dapat berjalan paralel.
+# Validasi hanya membaca data extract dan menghasilkan laporan kualitas data,
+# transform membaca data extract secara langsung
+class ValidateData(FingerprintTask):
+    dataset = luigi.ChoiceParameter(choices=DATASETS)  # amazon, product, atau mydramalist
+    sample_rows = luigi.IntParameter(default=0)  # Profil dihitung dari sampel acak jika > 0 (untuk data besar)
+    chunk_size = luigi.IntParameter(default=100000, significant=False)  # Jumlah baris yang dibaca per potongan saat membuat profil
+    max_missing_pct = luigi.FloatParameter(default=100.0)  # Task gagal jika persentase nilai kosong melebihi batas
+    column_max_missing_pct = luigi.DictParameter(default={})  # Batas khusus per kolom, misalnya {"brand": 5}
+
+    code_dependencies = ("src.helper.quality_helper",)
 
     def requires(self):
-        return [ExtractAmazonData(), ExtractProductData(), ExtractMydramalistData()]
+        return {
+            "amazon": ExtractAmazonData,
+            "product": ExtractProductData,
+            "mydramalist": ExtractMydramalistData,
+        }[self.dataset]()
     
-    def run(self):
-        for idx in range(0, 3):
-
-            # Membaca data dari task sebelumnya
-            data = pd.read_csv(self.input()[idx].path)
-
-            # Memulai data quality pipeline
-            print("===== Data Quality Pipeline Start =====")
-            print("")
-
-            # Memeriksa data shape
-            print("===== Check Data Shape =====")
-            print("")
-            print(f"Data Shape for this Data {data.shape}")
-
-            # Memeriksa tipe data
-            get_cols = data.columns
-
-            print("")
-            print("===== Check Data Types =====")
-            print("")
-
-            # Iterasi untuk setiap kolom
-            for col in get_cols:
-                 print(f"Column {col} has data type {data[col].dtypes}")
+    def complete(self):
+        # Laporan yang gagal (misalnya ditulis run lain dengan batas berbeda pada path yang sama) tidak dianggap selesai
+        if not super().complete():
+            return False
+        with self.output().open("r") as report_file:
+            return json.load(report_file).get("passed", False)
 
-            # Memeriksa nilai yang hilang
-            print("")
-            print("===== Check Missing Values =====")
-            print("")
-
-            # Iterasi untuk setiap kolom
-            for col in get_cols:
-                # menghitung nilai yang hilang
-                get_missing_values = (data[col].isnull().sum() * 100) / len(data)
-                print(f"Columns {col} has percentages missing values {get_missing_values} %")
-
-            print("===== Data Quality Pipeline End =====")
-            print("")
-
-            # Menyimpan data yang telah divalidasi ke CSV
-            data.to_csv(self.output()[idx].path, index=False)
+    def run(self):
+        source = self.input()
+
+        # Profil kualitas data (tipe data, nilai kosong, nilai unik, min/max) untuk semua kolom sekaligus,
+        # dihitung per potongan sehingga data tidak perlu dimuat seluruhnya. Sampel diambil saat membaca
+        total_rows = source.count_rows() if self.sample_rows else None
+        profile = profile_chunks(source.read_chunks(self.chunk_size), total_rows, sample_rows=self.sample_rows)
+        if profile.empty:
+            # File tanpa baris tidak menghasilkan potongan, kolomnya diambil dari file secara langsung
+            profile = profile_frame(source.read())
+        rows = profile.attrs["rows"]
+        violations = check_thresholds(profile, self.max_missing_pct, self.column_max_missing_pct)
+        report = build_report(self.dataset, profile, rows, violations)
+
+        print(f"===== Data Quality Report: {self.dataset} ({rows}, {len(profile)}) =====")
+        print(profile.to_string())
+        print("")
+
+        # Laporan selalu disimpan agar kolom yang gagal bisa diperiksa
+        with self.output().open("w") as report_file:
+            json.dump(report, report_file, indent=2)
+
+        # Fingerprint hanya dicatat jika task berhasil, sehingga validasi yang gagal dianggap belum selesai
+        if violations:
+            raise ValueError(f"Data quality check failed for {self.dataset}: {violations}")
 
     def output(self):
-        return [
-            luigi.LocalTarget("/Users/user/data-eng/data/validate/validate_amazon_data.csv"),
-            luigi.LocalTarget("/Users/user/data-eng/data/validate/validate_product_data.csv"),
-            luigi.LocalTarget("/Users/user/data-eng/data/validate/validate_mydramalist_data.csv")
-        ]
+        return luigi.LocalTarget(f"{DATA_DIR}/validate/validate_{self.dataset}_report.json")
+
+# Dijalankan di proses worker: membaca rentang barisnya sendiri dari file extract, menjalankan transform,
+# lalu menyerahkan hasilnya ke proses utama sebagai file Arrow IPC (tanpa pickle DataFrame)
+def transform_partition(task, source_path, source_format, start, stop, part_path):
+    data = read_range(source_path, source_format, start, stop)
+    write_frame(task.transform(data), part_path, "arrow")
+    return part_path
+
+# Dasar task transformasi: data dapat diproses sekaligus di memory, per potongan (chunked),
+# atau per rentang baris secara paralel di beberapa proses
+class TransformTask(FingerprintTask):
+    chunked = luigi.BoolParameter(default=False, significant=False)  # Memproses data per potongan sehingga memory dibatasi chunk_size
+    chunk_size = luigi.IntParameter(default=100000, significant=False)  # Jumlah baris per potongan pada mode chunked
+    processes = luigi.IntParameter(default=1, significant=False)  # Jumlah proses worker, > 1 menjalankan transform secara paralel
+
+    code_dependencies = ("src.helper.transform_helper",)
+
+    # Kolom yang di-backfill, nilai kosong di akhir potongan diisi dari potongan berikutnya
+    backfill_columns = []
+
+    def transform(self, data):
+        raise NotImplementedError
+
+    def transform_parallel(self, source, write, part_dir):
+        # Input dibagi menjadi rentang baris (maksimal chunk_size baris pada mode chunked)
+        total_rows = source.count_rows()
+        partition_size = max(math.ceil(total_rows / self.processes), 1)
+        if self.chunked:
+            partition_size = min(partition_size, self.chunk_size)
+        starts = list(range(0, total_rows, partition_size))
+        stops = [min(start + partition_size, total_rows) for start in starts]
+        part_paths = [os.path.join(part_dir, f"part-{idx:05d}.arrow") for idx in range(len(starts))]
+
+        def read_parts(paths):
+            # Hasil dibaca sesuai urutan rentang baris dan langsung dihapus setelah dibaca
+            for path in paths:
+                data = read_frame(path, "arrow")
+                os.remove(path)
+                yield data
+
+        with ProcessPoolExecutor(max_workers=self.processes) as executor:
+            finished = executor.map(
+                transform_partition, repeat(self), repeat(source.path), repeat(source.storage_format),
+                starts, stops, part_paths,
+            )
+            # Transform sudah dijalankan di worker, di sini hanya backfill antar rentang baris
+            return transform_in_chunks(read_parts(finished), lambda data: data, write, self.backfill_columns)
+
+    def run(self):
+        source = self.input()["data"]
+        output = self.output()
+
+        if not self.chunked and self.processes <= 1:
+            output.write(self.transform(source.read()))
+            return
+
+        # CSV tidak bisa dibaca per rentang baris tanpa memindai ulang file dari awal (dan review dapat
+        # berisi baris baru di dalam quote), sehingga pada mode paralel dibaca berurutan per potongan
+        parallel = self.processes > 1
+        if parallel and source.storage_format == "csv":
+            print(f"{self.task_family}: parallel transform needs parquet or arrow input, processing csv in chunks")
+            parallel = False
+
+        output.makedirs()
+        with output.temporary_path() as temp_path, output.writer(temp_path) as writer:
+            if parallel:
+                with tempfile.TemporaryDirectory(dir=os.path.dirname(output.path)) as part_dir:
+                    rows = self.transform_parallel(source, writer.write, part_dir)
+            else:
+                rows = transform_in_chunks(
+                    source.read_chunks(self.chunk_size), self.transform, writer.write, self.backfill_columns
+                )
+
+            # Tetap menulis header/schema walaupun data kosong
+            if rows == 0:
+                writer.write(self.transform(source.read()))
 
 # Proses Transformasi Amazon Data
-class TransformAmazonData(luigi.Task):
-    output_file = luigi.Parameter(default='/Users/user/data-eng/data/transform/transform_amazon_data.csv')
+class TransformAmazonData(TransformTask):
+    output_file = luigi.Parameter(default=f'{DATA_DIR}/transform/transform_amazon_data.csv')
+    numeric_engine = luigi.ChoiceParameter(choices=NUMERIC_ENGINES, default="auto", significant=False)  # pandas, pyarrow, atau auto
 
     def requires(self):
-        return ValidateData()
+        # Data dibaca langsung dari hasil extract setelah lolos validasi
+        return {"validate": ValidateData(dataset="amazon"), "data": ExtractAmazonData()}
 
     def output(self):
-        return luigi.LocalTarget(self.output_file)
-
-    def run(self):
-        transform_amazon_data = pd.read_csv(self.input()[0].path)
-
-        # Transformasi kolom 'ratings'
-        transform_amazon_data["ratings"] = (
-            transform_amazon_data["ratings"]
-                .replace(['Get', 'FREE'], np.nan) 
-                .replace({'₹': '', ',': ''}, regex=True) 
-                .fillna(0) 
-                .astype(float) 
-        )
-
-        # Transformasi kolom 'no_of_ratings'
-        transform_amazon_data["no_of_ratings"] = (
-            pd.to_numeric(transform_amazon_data["no_of_ratings"].replace(',', '', regex=True), errors='coerce').fillna(0).astype(int)
+        return data_target(self.output_file)
+
+    def transform(self, transform_amazon_data):
+        # Membersihkan kolom angka dalam satu pass dan downcast ke tipe data yang lebih kecil.
+        # Nilai yang tidak bisa diparse (misalnya 'Get' dan 'FREE' pada ratings) menjadi 0.
+        # Kolom harga tetap float64 agar nilai uang tidak berubah karena pembulatan float32
+        transform_amazon_data["ratings"] = clean_numeric(
+            transform_amazon_data["ratings"], strip_chars="₹,", dtype="float32", engine=self.numeric_engine
         )
-
-        # Transformasi kolom 'discount_price'
-        transform_amazon_data["discount_price"] = (
-            transform_amazon_data["discount_price"]
-                .replace({'₹': '', ',': ''}, regex=True)
-                .replace('', np.nan) 
-                .fillna(0) 
-                .astype(float)
-        )
-
-        # Transformasi kolom 'actual_price'
-        transform_amazon_data["actual_price"] = (
-            transform_amazon_data["actual_price"]
-                .replace({'₹': '', ',': ''}, regex=True) 
-                .fillna(0) 
-                .astype(float) 
+        transform_amazon_data["no_of_ratings"] = clean_numeric(
+            transform_amazon_data["no_of_ratings"], strip_chars=",", dtype="int32", engine=self.numeric_engine
         )
+        for col in ["discount_price", "actual_price"]:
+            transform_amazon_data[col] = clean_numeric(
+                transform_amazon_data[col], strip_chars="₹,", dtype="float64", engine=self.numeric_engine
+            )
 
         # Hapus kolom 'Unnamed: 0' 
         transform_amazon_data.drop(columns=['Unnamed: 0'], errors='ignore', inplace=True)
-
-        # Menyimpan hasil transformasi ke CSV
-        transform_amazon_data.to_csv(self.output().path, index=False)
+        return transform_amazon_data
 
 # Proses Transformasi Product Data
-class TransformProductData(luigi.Task):
-    output_file = luigi.Parameter(default="/Users/user/data-eng/data/transform/transform_product_data.csv")
+class TransformProductData(TransformTask):
+    output_file = luigi.Parameter(default=f"{DATA_DIR}/transform/transform_product_data.csv")
+
+    # Kolom tanggal dan kolom kategori dengan aturan fill 'bfill' (Shipping)
+    backfill_columns = ['DateAdded', 'DateUpdated', 'DateSeen'] + [
+        col for col, rule in PRODUCT_NORMALIZATION_RULES.items() if rule.get('fill') == 'bfill'
+    ]
 
     def requires(self):
-        return ValidateData() 
+        # Data dibaca langsung dari hasil extract setelah lolos validasi
+        return {"validate": ValidateData(dataset="product"), "data": ExtractProductData()}
 
     def output(self):
-        return luigi.LocalTarget(self.output_file)
-
-    def run(self):
-        # Membaca data dari CSV
-        transform_product_data = pd.read_csv(self.input()[1].path) 
+        return data_target(self.output_file)
 
+    def transform(self, transform_product_data):
         # Daftar kolom yang dipilih
         selected_columns = [
             'id', 'prices.amountMax', 'prices.amountMin', 'prices.availability', 'prices.condition',
@@ -231,7 +442,7 @@ class TransformProductData(luigi.Task):
 
         # Menyaring kolom yang dipilih
         available_columns = [col for col in selected_columns if col in transform_product_data.columns]
-        transform_product_data = transform_product_data[available_columns]
+        transform_product_data = transform_product_data[available_columns].copy()
 
         # Mengganti nama kolom untuk kemudahan
         transform_product_data.rename(columns={
@@ -243,161 +454,122 @@ class TransformProductData(luigi.Task):
             'dateUpdated': 'DateUpdated', 'primaryCategories': 'MainCategories'
         }, inplace=True)
 
-        # Mapping nilai kolom
-        transform_product_data.replace({
-            'Availability': {
-                'Yes': 'In Stock', 'In Stock': 'In Stock', 'TRUE': 'In Stock', 
-                'undefined': 'Sold', 'yes': 'In Stock', 'Out Of Stock': 'Sold', 
-                'Special Order': 'In Stock', 'No': 'Sold', 'More on the Way': 'Sold', 
-                'sold': 'Sold', 'FALSE': 'Sold', 'Retired': 'Sold', '32 available:': 'In Stock', 
-                '7 available': 'In Stock'
-            },
-            'Condition': {
-                'New': 'New', 'new': 'New', 'Seller refurbished': 'Used', 
-                'Used': 'Used', 'pre-owned': 'Used', 'Refurbished': 'Used', 
-                'Manufacturer refurbished': 'Used'
-            },
-            'isSale': {False: 'No', True: 'Yes'},
-            'Shipping': {
-                'Expedited': 'Charges Apply', 'Value': 'Charges Apply', 
-                'Standard': 'Charges Apply', 'Free Shipping on orders 35 and up': 'Free Shipping', 
-                'Free Expedited Shipping': 'Free Shipping', 
-                'Free Shipping on orders 35 and up': 'Free Shipping', 
-                'Free Expedited Shipping for most orders over $49': 'Free Shipping',
-                'FREE': 'Free Shipping', 'Freight': 'Charges Apply', 
-                'Free Shipping for this Item': 'Free Shipping', 
-                'Free Standard Shipping on Orders Over $49': 'Free Shipping', 
-                'Free Delivery': 'Free Shipping', 
-                'Free Standard Shipping': 'Free Shipping', 
-                'Shipping Charges Apply': 'Charges Apply', 
-                'Free Next Day Delivery (USA)': 'Free Shipping'
-            }
-        }, inplace=True)
-
-        # Mengganti nilai Shipping yang mengandung USD/CAD 
-        if 'Shipping' in transform_product_data.columns:
-            transform_product_data['Shipping'] = (
-                transform_product_data['Shipping']
-                .replace(r'.*\bUSD\b.*|.*\bCAD\b.*', 'Charges Apply', regex=True)
-                .fillna(method='bfill')
-            )
+        # Normalisasi kolom Availability, Condition, isSale, dan Shipping (termasuk nilai USD/CAD).
+        # Kolom diubah menjadi category sehingga mapping hanya dijalankan per nilai unik
+        for col, rule in PRODUCT_NORMALIZATION_RULES.items():
+            if col in transform_product_data.columns:
+                transform_product_data[col] = normalize_categorical(transform_product_data[col], rule)
 
         # Mengganti tipe data kolom DateAdded, DateUpdated, dan DateSeen menjadi datetime
+        # (utc=True agar tipe kolom sama walaupun sebuah potongan hanya berisi nilai kosong)
         date_columns = ['DateAdded', 'DateUpdated', 'DateSeen']
         for col in date_columns:
-           transform_product_data[col] = pd.to_datetime(transform_product_data[col], errors='coerce').fillna(method='bfill')
-     
-        # Menyimpan hasil transformasi ke CSV
-        transform_product_data.to_csv(self.output().path, index=False)  
+           transform_product_data[col] = pd.to_datetime(transform_product_data[col], errors='coerce', utc=True).bfill()
+
+        # Tipe category dan datetime tetap tersimpan pada parquet/arrow
+        return transform_product_data
+
+# Format tanggal review MyDramalist
+REVIEW_DATE_FORMAT = "%b %d, %Y"
 
 # Proses Transformasi MyDramalist Data
-class TransformMydramalistData(luigi.Task):
-    output_file = luigi.Parameter(default="/Users/user/data-eng/data/transform/transform_mydramalist_data.csv")  # Jalur file CSV keluaran
+class TransformMydramalistData(TransformTask):
+    output_file = luigi.Parameter(default=f"{DATA_DIR}/transform/transform_mydramalist_data.csv")  # Jalur file CSV keluaran
 
     def requires(self):
-        return ValidateData()  # Mengharuskan tugas validasi data sebelumnya
+        # Data dibaca langsung dari hasil extract setelah lolos validasi
+        return {"validate": ValidateData(dataset="mydramalist"), "data": ExtractMydramalistData()}
+
+    def transform(self, transform_mydramalist_data):
+        # Mengonversi kolom review_date ke format datetime dengan format tanggal MyDramalist (misalnya "Nov  9, 2018").
+        # Format eksplisit agar hasilnya tidak bergantung pada nilai pertama potongan ("May" juga cocok dengan %B)
+        transform_mydramalist_data['review_date'] = pd.to_datetime(
+            transform_mydramalist_data['review_date'], format=REVIEW_DATE_FORMAT, errors='coerce'
+        )
 
-    def run(self):
-        # Membaca data dari task sebelumnya
-        transform_mydramalist_data = pd.read_csv(self.input()[2].path)  # Mengambil path dari input dan membaca CSV
-
-        # Mengonversi kolom review_date ke format datetime
-        transform_mydramalist_data['review_date'] = pd.to_datetime(transform_mydramalist_data['review_date'], errors='coerce')
-
-        # Daftar untuk menyimpan kolom review body yang dipecah menjadi beberapa kolom
-        overall_ratings = []
-        story_ratings = []
-        acting_ratings = []
-        music_ratings = []
-        rewatch_value_ratings = []
-        reviews = []
-
-        # Mengekstrak rating dan ulasan dari setiap review_body
-        for review_body in transform_mydramalist_data['review_body']:
-            # Menggunakan regex untuk mengekstrak rating
-            overall = re.search(r'Overall\s*(\d+(\.\d+)?)', review_body, re.IGNORECASE)
-            story = re.search(r'Story\s*(\d+(\.\d+)?)', review_body, re.IGNORECASE)
-            acting_cast = re.search(r'Acting/Cast\s*(\d+(\.\d+)?)', review_body, re.IGNORECASE)
-            music = re.search(r'Music\s*(\d+(\.\d+)?)', review_body, re.IGNORECASE)
-            rewatch_value = re.search(r'Rewatch Value\s*(\d+(\.\d+)?)', review_body, re.IGNORECASE)
-
-            # Menambahkan nilai yang diekstrak atau "N/A"
-            overall_ratings.append(overall.group(1) if overall else "0")
-            story_ratings.append(story.group(1) if story else "0")
-            acting_ratings.append(acting_cast.group(1) if acting_cast else "0")
-            music_ratings.append(music.group(1) if music else "0")
-            rewatch_value_ratings.append(rewatch_value.group(1) if rewatch_value else "0")
-            
-            # Memecah kolom 
-            review_text = re.split(r'Overall\s*\d+(\.\d+)?|Story\s*\d+(\.\d+)?|Acting/Cast\s*\d+(\.\d+)?|Music\s*\d+(\.\d+)?|Rewatch Value\s*\d+(\.\d+)?', review_body)
-            reviews.append(review_text[-1].strip())  
-
-        # Membuat kolom baru di DataFrame
-        transform_mydramalist_data['overall_rating'] = overall_ratings
-        transform_mydramalist_data['story_rating'] = story_ratings
-        transform_mydramalist_data['acting_rating'] = acting_ratings
-        transform_mydramalist_data['music_rating'] = music_ratings
-        transform_mydramalist_data['rewatch_value'] = rewatch_value_ratings
-        transform_mydramalist_data['reviews'] = reviews
-
-        # Mengonversi kolom rating menjadi tipe float dan mengubah missing value menjadi 0
-        rating_columns = ['overall_rating', 'story_rating', 'acting_rating', 'music_rating', 'rewatch_value']
-        for col in rating_columns:
-            transform_mydramalist_data[col] = pd.to_numeric(transform_mydramalist_data[col], errors='coerce').fillna(0).astype(float)
+        # Mengekstrak kelima rating dan isi ulasan dari review_body dalam satu pass vectorized
+        ratings = extract_ratings(transform_mydramalist_data['review_body'])
+        for col in ratings.columns:
+            transform_mydramalist_data[col] = ratings[col]
 
         # Menghapus kolom review_body
         transform_mydramalist_data.drop(columns=['review_body'], inplace=True)
-
-        # Menyimpan hasil transformasi ke CSV
-        transform_mydramalist_data.to_csv(self.output().path, index=False)
+        return transform_mydramalist_data
     
     def output(self):
-        return luigi.LocalTarget(self.output_file) 
+        return data_target(self.output_file) 
+
+# Proses Load data, satu task untuk setiap dataset
+class LoadData(FingerprintTask):
+    dataset = luigi.ChoiceParameter(choices=DATASETS)  # amazon, product, atau mydramalist
+    load_method = luigi.ChoiceParameter(choices=LOAD_METHODS, default="copy", significant=False)  # copy (COPY FROM STDIN) atau insert
+    load_mode = luigi.ChoiceParameter(choices=LOAD_MODES, default="default")  # default (append/replace) atau upsert
+
+    # Tabel tujuan untuk setiap dataset
+    tables = {
+        "amazon": "AmazonData",
+        "product": "ProductData",
+        "mydramalist": "MydramalistData",
+    }
+
+    code_dependencies = ("src.helper.load_helper",)
 
-# Proses Load semua data 
-class LoadData(luigi.Task):
     def requires(self):
-        return [
-            TransformAmazonData(),  
-            TransformProductData(),
-            TransformMydramalistData()
-        ]
+        return {
+            "amazon": TransformAmazonData,
+            "product": TransformProductData,
+            "mydramalist": TransformMydramalistData,
+        }[self.dataset]()
 
     def output(self):
-        return [
-            luigi.LocalTarget("/Users/user/data-eng/data/load/load_amazon_data.csv"),
-            luigi.LocalTarget("/Users/user/data-eng/data/load/load_product_data.csv"),
-            luigi.LocalTarget("/Users/user/data-eng/data/load/load_mydramalist_data.csv")
-        ]
+        return data_target(f"{DATA_DIR}/load/load_{self.dataset}_data.csv")
+
+    def if_exists(self):
+        # Extract penuh (CSV product, halaman review, atau amazon_sales_data tanpa incremental) menggantikan
+        # isi tabel, sehingga run ulang karena fingerprint berubah tidak menduplikasi baris.
+        # Hanya delta dari extract incremental yang di-append; run incremental pertama (belum ada watermark)
+        # mengambil seluruh tabel sehingga ikut menggantikan isi tabel
+        if self.dataset == "amazon" and ExtractAmazonData().incremental \
+                and not is_pending_full_extract(ExtractAmazonData.source_table):
+            return "append"
+        return "replace"
 
     def run(self):
-        # Inisialisasi PostgreSQL engine
+        # Engine PostgreSQL (dipakai ulang dari pool per proses)
         engine = postgres_load_engine() 
 
         # Membaca data dari task sebelumnya
-        load_amazon_data = pd.read_csv(self.input()[0].path)
-        load_product_data = pd.read_csv(self.input()[1].path)
-        load_mydramalist_data = pd.read_csv(self.input()[2].path)
+        load_data = self.input().read()
+        table_name, if_exists = self.tables[self.dataset], self.if_exists()
 
         # Menyimpan data ke database
-        load_amazon_data.to_sql("AmazonData", con=engine, if_exists="append", index=False)
-        load_product_data.to_sql("ProductData", con=engine, if_exists="append", index=False)
-        load_mydramalist_data.to_sql("MydramalistData", con=engine, if_exists="replace", index=False)
+        if self.load_mode == "upsert":
+            # Upsert berdasarkan natural key sehingga rerun hanya menyentuh baris yang berubah
+            upsert_dataframe(load_data, table_name, engine)
+        elif if_exists == "append" and not has_pending_watermark(ExtractAmazonData.source_table):
+            # Delta ini sudah di-load dan watermark-nya sudah di-commit (task berjalan ulang karena
+            # kode atau parameter berubah), sehingga tidak di-append dua kali
+            print(f"Delta for {table_name} was already loaded, skipping append")
+        else:
+            load_dataframe(load_data, table_name, engine, if_exists=if_exists, method=self.load_method)
+
+        # Menandai delta Amazon sudah berhasil di-load sehingga run berikutnya mulai dari watermark ini
+        if self.dataset == "amazon":
+            commit_watermark(ExtractAmazonData.source_table)
+
+        report_engine_stats(engine, "LoadData")
 
-        # Menyimpan data ke CSV
-        load_amazon_data.to_csv(self.output()[0].path, index=False)
-        load_product_data.to_csv(self.output()[1].path, index=False)
-        load_mydramalist_data.to_csv(self.output()[2].path, index=False)
+        # Menyimpan data yang sudah di-load
+        self.output().write(load_data)
+
+# Menjalankan ketiga branch pipeline (extract -> validate -> transform -> load) sekaligus
+class ETLPipeline(luigi.WrapperTask):
+
+    def requires(self):
+        return [LoadData(dataset=dataset) for dataset in DATASETS]
 
- # Memanggil build Luigi untuk menjalankan task dalam ETL pipeline 
+ # Memanggil build Luigi untuk menjalankan task dalam ETL pipeline.
+ # Satu worker untuk setiap dataset sehingga ketiga branch berjalan bersamaan
+ # dan durasi pipeline mengikuti branch yang paling lambat
 if __name__ == "__main__":
-    luigi.build([
-        ExtractAmazonData(),
-        ExtractProductData(),
-        ExtractMydramalistData(),
-        ValidateData(),
-        TransformAmazonData(),
-        TransformProductData(),
-        TransformMydramalistData(),
-        LoadData(),
-    ], local_scheduler=True)
\ No newline at end of file
+    luigi.build([ETLPipeline()], local_scheduler=True, workers=len(DATASETS))
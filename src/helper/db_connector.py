@@ -1,5 +1,10 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import QueuePool
+import atexit
 import os
+import threading
+import time
 from dotenv import load_dotenv
 
 # Load .env file
@@ -19,21 +24,167 @@ LOAD_DB_HOST = os.getenv("LOAD_DB_HOST")
 LOAD_DB_PORT = os.getenv("LOAD_DB_PORT", "5433")  
 LOAD_DB_NAME = os.getenv("LOAD_DB_NAME")
 
+# URL database lengkap (misalnya sqlite:///bench.db) yang menggantikan pengaturan di atas jika diisi
+SOURCE_DB_URL = os.getenv("SOURCE_DB_URL")
+LOAD_DB_URL = os.getenv("LOAD_DB_URL")
+
+# Pengaturan connection pool, berlaku untuk semua engine
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))  # Jumlah koneksi yang disimpan di pool
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))  # Koneksi tambahan di atas pool_size saat sibuk
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))  # Batas waktu menunggu koneksi dari pool (detik)
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # Koneksi yang lebih tua dari ini dibuka ulang (detik)
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")  # Cek koneksi sebelum dipakai
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0"))  # statement_timeout PostgreSQL, 0 = tanpa batas
+DB_INSERT_PAGE_SIZE = int(os.getenv("DB_INSERT_PAGE_SIZE", "1000"))  # Jumlah baris per INSERT ... VALUES saat executemany
+
+
+class PoolStats:
+    """
+    Class untuk menghitung jumlah koneksi baru yang dibuka ke database,
+    jumlah checkout koneksi dari pool, dan total waktu menunggu checkout.
+    """
+
+    def __init__(self):
+        self.connections_opened = 0
+        self.checkouts = 0
+        self.checkout_wait = 0.0
+        self._lock = threading.Lock()
+
+    def opened(self):
+        with self._lock:
+            self.connections_opened += 1
+
+    def checked_out(self, seconds):
+        with self._lock:
+            self.checkouts += 1
+            self.checkout_wait += seconds
+
+    def as_dict(self):
+        return {
+            "connections_opened": self.connections_opened,
+            "checkouts": self.checkouts,
+            "checkout_wait_seconds": round(self.checkout_wait, 4),
+        }
+
+
+class TimedQueuePool(QueuePool):
+    """
+    QueuePool yang mencatat waktu setiap checkout (menunggu koneksi kosong, membuka koneksi baru,
+    dan pre-ping) ke PoolStats. Statistik tetap sama setelah pool dibuat ulang oleh engine.dispose().
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def connect(self):
+        start_time = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            self.stats.checked_out(time.perf_counter() - start_time)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+
+# Satu engine untuk setiap DSN per proses, beserta pid proses yang membuatnya
+_ENGINES = {}
+_ENGINES_LOCK = threading.Lock()
+
+
+def _engine_options(url):
+    # SQLite in-memory hanya bisa memakai satu koneksi, sehingga memakai pool bawaan SQLAlchemy
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}
+
+    options = {
+        "poolclass": TimedQueuePool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+        "insertmanyvalues_page_size": DB_INSERT_PAGE_SIZE,
+    }
+    if url.get_driver_name() == "psycopg2":
+        # INSERT executemany memakai insertmanyvalues, UPDATE/DELETE executemany memakai execute_batch psycopg2
+        options["executemany_mode"] = "values_plus_batch"
+    if url.get_backend_name() == "postgresql" and DB_STATEMENT_TIMEOUT_MS:
+        options["connect_args"] = {"options": f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"}
+    return options
+
+
+def get_engine(dsn):
+    """
+    Function yang digunakan untuk mengambil engine untuk sebuah DSN. Engine dibuat sekali per proses
+    lalu dipakai ulang, sehingga setiap task memakai connection pool yang sama.
+    Proses hasil fork (misalnya worker Luigi) tidak memakai koneksi milik proses induk.
+    """
+    with _ENGINES_LOCK:
+        pid, engine = _ENGINES.get(dsn, (None, None))
+        if engine is not None and pid != os.getpid():
+            # Koneksi milik proses induk dilepas tanpa ditutup agar tetap bisa dipakai proses induk
+            engine.dispose(close=False)
+            engine.pool.stats = PoolStats()
+            _ENGINES[dsn] = (os.getpid(), engine)
+        elif engine is None:
+            url = make_url(dsn)
+            engine = create_engine(url, **_engine_options(url))
+            if isinstance(engine.pool, TimedQueuePool):
+                event.listen(engine, "connect", lambda *args: engine.pool.stats.opened())
+            _ENGINES[dsn] = (os.getpid(), engine)
+        return engine
+
+
+def engine_stats(engine):
+    """
+    Function yang digunakan untuk mengambil statistik pool sebuah engine
+    (koneksi yang dibuka, jumlah checkout, dan total waktu menunggu checkout).
+    """
+    stats = getattr(engine.pool, "stats", None)
+    return stats.as_dict() if stats is not None else {}
+
+
+def report_engine_stats(engine, label):
+    # Menampilkan ringkasan pool ke stdout (masuk ke log/load_data.log)
+    stats = engine_stats(engine)
+    if stats:
+        print(
+            f"[{label}] {engine.url.render_as_string(hide_password=True)}: "
+            f"{stats['connections_opened']} connections opened, {stats['checkouts']} checkouts, "
+            f"{stats['checkout_wait_seconds']:.4f}s waiting for checkout"
+        )
+
+
+@atexit.register
+def dispose_engines():
+    """
+    Function yang digunakan untuk menutup semua koneksi di pool milik proses ini,
+    dijalankan otomatis saat proses selesai.
+    """
+    with _ENGINES_LOCK:
+        for pid, engine in _ENGINES.values():
+            if pid == os.getpid():
+                engine.dispose()
+        _ENGINES.clear()
+
+
 def postgres_amazon_engine():
     """
-    Function yang digunakan untuk membuat engine postgres
+    Function yang digunakan untuk mengambil engine postgres
     yang tujuannya untuk fetch data dari amazon database.
     Sesuaikan username, password, host, dan nama database dengan milik masing - masing
 
     """
-    engine = create_engine(f"postgresql://{SOURCE_DB_USERNAME}:{SOURCE_DB_PASSWORD}@{SOURCE_DB_HOST}:{SOURCE_DB_PORT}/{SOURCE_DB_NAME}")
-    return engine
+    return get_engine(SOURCE_DB_URL or f"postgresql://{SOURCE_DB_USERNAME}:{SOURCE_DB_PASSWORD}@{SOURCE_DB_HOST}:{SOURCE_DB_PORT}/{SOURCE_DB_NAME}")
 
 def postgres_load_engine():
     """
-    Function yang digunakan untuk membuat engine postgres
+    Function yang digunakan untuk mengambil engine postgres
     yang tujuannya untuk load data ke recommender system database.
     Sesuaikan username, password, host, dan nama database dengan milik masing - masing
     """
-    load_engine = create_engine(f"postgresql://{LOAD_DB_USERNAME}:{LOAD_DB_PASSWORD}@{LOAD_DB_HOST}:{LOAD_DB_PORT}/{LOAD_DB_NAME}")
-    return load_engine
+    return get_engine(LOAD_DB_URL or f"postgresql://{LOAD_DB_USERNAME}:{LOAD_DB_PASSWORD}@{LOAD_DB_HOST}:{LOAD_DB_PORT}/{LOAD_DB_NAME}")
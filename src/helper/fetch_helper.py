@@ -0,0 +1,174 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from tqdm import tqdm
+
+from src.helper.metrics_helper import ThroughputMeter
+
+# Status HTTP yang layak dicoba ulang
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class RateLimiter:
+    """
+    Class yang digunakan untuk membatasi jumlah request per detik ke setiap host.
+    Aman dipakai bersama oleh banyak thread.
+    """
+
+    def __init__(self, requests_per_second):
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self.next_slot = {}
+        self.lock = threading.Lock()
+
+    def wait(self, url):
+        if not self.interval:
+            return
+
+        host = urlparse(url).netloc
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot.get(host, now))
+            self.next_slot[host] = slot + self.interval
+
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+class FetchedPage:
+    """
+    Hasil fetch satu halaman, baik dari jaringan maupun dari cache.
+    `unchanged` bernilai True jika isi halaman sama dengan versi di cache.
+    """
+
+    def __init__(self, url, content, encoding, unchanged=False, from_network=True):
+        self.url = url
+        self.content = content
+        self.encoding = encoding
+        self.unchanged = unchanged
+        self.from_network = from_network
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+
+class PageFetcher:
+    """
+    Class yang digunakan untuk mengambil banyak halaman secara concurrent dengan
+    satu session keep-alive, jumlah worker terbatas, rate limit per host,
+    timeout, dan retry dengan exponential backoff.
+    Jika `cache` (ResponseCache) diberikan, halaman yang masih fresh diambil dari disk
+    dan halaman lama direvalidasi dengan ETag/Last-Modified.
+    """
+
+    def __init__(self, max_workers=8, requests_per_second=5.0, timeout=10.0, retries=3, backoff_factor=0.5,
+                 cache=None):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.rate_limiter = RateLimiter(requests_per_second)
+        self.cache = cache
+
+        # Satu session dengan connection pool sebesar jumlah worker agar koneksi dipakai ulang
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def request(self, url, headers=None):
+        """
+        Mengirim GET request dan mengembalikan response.
+        Error koneksi, timeout, dan status pada RETRY_STATUS dicoba ulang sampai `retries` kali.
+        """
+        for attempt in range(self.retries + 1):
+            self.rate_limiter.wait(url)
+            try:
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+                if response.status_code not in RETRY_STATUS or attempt == self.retries:
+                    response.raise_for_status()
+                    return response
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.retries:
+                    raise
+
+            time.sleep(self.backoff_factor * (2 ** attempt))
+
+    def fetch(self, url, cache_only=False):
+        """
+        Mengambil satu halaman dan mengembalikan FetchedPage.
+        cache_only=True memakai versi cache tanpa revalidasi jika tersedia.
+        """
+        entry, cached_content = self.cache.get(url) if self.cache else (None, None)
+
+        if entry is not None and (cache_only or self.cache.is_fresh(entry)):
+            return FetchedPage(url, cached_content, entry["encoding"], unchanged=True, from_network=False)
+
+        headers = self.cache.revalidation_headers(entry) if entry is not None else None
+        response = self.request(url, headers=headers)
+
+        # 304 Not Modified, halaman di cache masih berlaku
+        if response.status_code == 304 and entry is not None:
+            self.cache.touch(url)
+            return FetchedPage(url, cached_content, entry["encoding"], unchanged=True)
+
+        encoding = response.encoding or response.apparent_encoding
+        unchanged = False
+        if self.cache:
+            unchanged = not self.cache.store(url, response.content, response.headers, encoding)
+        return FetchedPage(url, response.content, encoding, unchanged=unchanged)
+
+    def fetch_all(self, urls, parse, desc="Fetching Pages", stop_when_unchanged=False):
+        """
+        Mengambil semua url secara concurrent dan menjalankan `parse(page)` di worker
+        yang sama, sehingga parsing satu halaman overlap dengan fetch halaman lain.
+        Hasil dikembalikan sesuai urutan `urls`.
+
+        stop_when_unchanged=True mengambil halaman per gelombang sesuai urutan; setelah ada
+        halaman yang tidak berubah dibanding cache, halaman berikutnya langsung diambil dari
+        cache tanpa request (pagination berhenti), kecuali halaman yang belum pernah di-cache.
+        """
+        meter = ThroughputMeter(desc, unit="pages")
+        results = [None] * len(urls)
+        wave_size = self.max_workers if stop_when_unchanged and self.cache else len(urls)
+        cache_only = False
+        network_pages = 0
+
+        def fetch_and_parse(url, cache_only):
+            page = self.fetch(url, cache_only=cache_only)
+            return page, parse(page)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor, \
+                tqdm(total=len(urls), desc=desc) as progress:
+            for wave_start in range(0, len(urls), max(wave_size, 1)):
+                wave = range(wave_start, min(wave_start + wave_size, len(urls)))
+                futures = {executor.submit(fetch_and_parse, urls[idx], cache_only): idx for idx in wave}
+
+                for future in as_completed(futures):
+                    page, results[futures[future]] = future.result()
+                    network_pages += page.from_network
+                    cache_only = cache_only or (stop_when_unchanged and page.unchanged)
+                    meter.add(1)
+                    progress.update(1)
+
+        if self.cache:
+            print(f"[{desc}] {network_pages} of {len(urls)} pages requested from the network")
+
+        meter.report()
+        return results
+
+    def close(self):
+        if self.cache:
+            self.cache.flush()
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
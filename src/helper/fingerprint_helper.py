@@ -0,0 +1,148 @@
+import functools
+import hashlib
+import importlib
+import inspect
+import json
+import os
+
+import luigi
+from luigi.task import flatten
+
+# Sidecar berisi fingerprint task yang membuat sebuah output, disimpan di samping output tersebut
+FINGERPRINT_SUFFIX = ".fingerprint.json"
+
+
+def _sha256(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _file_state(path):
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+@functools.lru_cache(maxsize=256)
+def _content_digest(path, size, mtime_ns):
+    # Ukuran dan mtime menjadi bagian key sehingga file yang berubah selalu di-hash ulang
+    digest = hashlib.sha256()
+    with open(path, "rb") as data_file:
+        for block in iter(lambda: data_file.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def read_sidecar(path):
+    sidecar_path = path + FINGERPRINT_SUFFIX
+    if not os.path.exists(sidecar_path):
+        return {}
+    with open(sidecar_path, encoding="utf-8") as sidecar_file:
+        return json.load(sidecar_file)
+
+
+def write_sidecar(path, data):
+    # Menulis ke file sementara lalu rename agar sidecar tidak pernah setengah tertulis
+    sidecar_path = path + FINGERPRINT_SUFFIX
+    temp_path = f"{sidecar_path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as sidecar_file:
+        json.dump(data, sidecar_file, indent=2)
+    os.replace(temp_path, sidecar_path)
+
+
+def file_digest(path):
+    """
+    Function yang digunakan untuk mengambil hash isi sebuah file (sha256).
+    Jika file dibuat oleh task yang memiliki fingerprint dan belum berubah sejak itu,
+    hash diambil dari sidecar-nya sehingga file tidak perlu dibaca ulang.
+    """
+    state = _file_state(path)
+    sidecar = read_sidecar(path)
+    if sidecar.get("output_state") == state:
+        return sidecar["output_digest"]
+    return _content_digest(path, *state)
+
+
+@functools.lru_cache(maxsize=None)
+def code_version(task_class):
+    """
+    Function yang digunakan untuk membuat versi kode sebuah task dari source code class task
+    (termasuk class induk di modul yang sama) dan modul helper pada `code_dependencies`.
+    """
+    sources = [
+        inspect.getsource(cls) for cls in task_class.__mro__
+        if cls.__module__ == task_class.__module__
+    ]
+    sources += [
+        inspect.getsource(importlib.import_module(module)) for module in task_class.code_dependencies
+    ]
+    return _sha256("\n".join(sources))
+
+
+class FingerprintTask(luigi.Task):
+    """
+    Task yang dianggap selesai hanya jika outputnya ada dan fingerprint-nya (hash input, parameter,
+    versi kode, dan penanda data sumber) sama dengan fingerprint saat output dibuat.
+    Task upstream ikut diperiksa, sehingga perubahan di satu branch hanya menjalankan ulang branch tersebut.
+    """
+
+    # Modul helper (nama modul) yang ikut menentukan hasil task
+    code_dependencies = ()
+
+    def source_fingerprint(self):
+        # Task sumber dapat mengembalikan penanda data sumber, misalnya hash file input
+        return None
+
+    @functools.cached_property
+    def source_marker(self):
+        # complete() dipanggil berulang kali saat penjadwalan (setiap task downstream memeriksa upstream-nya),
+        # sehingga penanda sumber cukup dihitung sekali per instance task (Luigi memakai ulang instance
+        # dengan parameter yang sama) dan ikut terbawa ke proses worker
+        return self.source_fingerprint()
+
+    def fingerprint_path(self):
+        return flatten(self.output())[0].path
+
+    def input_targets(self):
+        # Sama seperti flatten(self.input()), tetapi tetap berjalan jika requires() mengembalikan None
+        return flatten([task.output() for task in flatten(self.requires())])
+
+    def fingerprint(self):
+        payload = {
+            "task": self.task_family,
+            "params": self.to_str_params(only_significant=True),
+            "code": code_version(type(self)),
+            "inputs": [file_digest(target.path) for target in self.input_targets()],
+            "source": self.source_marker,
+        }
+        return _sha256(json.dumps(payload, sort_keys=True, default=str))
+
+    def complete(self):
+        if not all(target.exists() for target in flatten(self.output())):
+            return False
+        if not all(task.complete() for task in flatten(self.requires())):
+            return False
+        return read_sidecar(self.fingerprint_path()).get("fingerprint") == self.fingerprint()
+
+
+@FingerprintTask.event_handler(luigi.Event.START)
+def _prepare_rerun(task):
+    # Fingerprint dihitung sebelum run agar perubahan data sumber selama run tidak ikut tercatat,
+    # dan output lama dihapus karena LocalTarget tidak menimpa file yang sudah ada.
+    # Sidecar lama ikut dihapus sehingga output dari run yang gagal tidak dianggap selesai
+    task.pending_fingerprint = task.fingerprint()
+    sidecar_path = task.fingerprint_path() + FINGERPRINT_SUFFIX
+    if os.path.exists(sidecar_path):
+        os.remove(sidecar_path)
+    for target in flatten(task.output()):
+        if target.exists():
+            target.remove()
+
+
+@FingerprintTask.event_handler(luigi.Event.SUCCESS)
+def _record_fingerprint(task):
+    path = task.fingerprint_path()
+    write_sidecar(path, {
+        "task": task.task_id,
+        "fingerprint": task.pending_fingerprint,
+        "output_digest": _content_digest(path, *_file_state(path)),
+        "output_state": _file_state(path),
+    })
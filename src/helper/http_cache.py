@@ -0,0 +1,140 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+
+class ResponseCache:
+    """
+    Class yang digunakan untuk menyimpan halaman hasil fetch di disk.
+    Isi halaman disimpan secara content-addressed (nama file = sha256 isi halaman),
+    sedangkan index.json memetakan url ke blob beserta ETag/Last-Modified untuk revalidasi.
+    Entry yang lebih tua dari `ttl` detik direvalidasi, dan entry yang paling lama
+    tidak diakses dihapus ketika total ukuran melebihi `max_bytes` (LRU).
+    """
+
+    def __init__(self, cache_dir, ttl=12 * 3600, max_bytes=100 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.blob_dir = os.path.join(cache_dir, "blobs")
+        self.index_path = os.path.join(cache_dir, "index.json")
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+
+        os.makedirs(self.blob_dir, exist_ok=True)
+        self.index = {}
+        if os.path.exists(self.index_path):
+            with open(self.index_path, encoding="utf-8") as index_file:
+                self.index = json.load(index_file)
+
+    def _blob_path(self, digest):
+        return os.path.join(self.blob_dir, digest)
+
+    def get(self, url):
+        """
+        Mengembalikan (entry, content) untuk url atau (None, None) jika belum tersimpan.
+        """
+        with self.lock:
+            entry = self.index.get(url)
+            if entry is None or not os.path.exists(self._blob_path(entry["blob"])):
+                return None, None
+            entry["last_access"] = time.time()
+
+        with open(self._blob_path(entry["blob"]), "rb") as blob_file:
+            return entry, blob_file.read()
+
+    def is_fresh(self, entry):
+        return time.time() - entry["fetched_at"] < self.ttl
+
+    def revalidation_headers(self, entry):
+        # Header conditional request agar server cukup membalas 304 jika halaman tidak berubah
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def touch(self, url):
+        # Halaman tervalidasi ulang (304), perpanjang umur entry
+        with self.lock:
+            now = time.time()
+            self.index[url]["fetched_at"] = now
+            self.index[url]["last_access"] = now
+
+    def store(self, url, content, headers, encoding):
+        """
+        Menyimpan halaman ke cache dan mengembalikan True jika isinya berbeda
+        dengan versi yang tersimpan sebelumnya.
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        blob_path = self._blob_path(digest)
+
+        # Blob ditulis di dalam lock agar tidak dihapus thread lain sebelum tercatat di index
+        with self.lock:
+            if not os.path.exists(blob_path):
+                temp_path = f"{blob_path}.{threading.get_ident()}.tmp"
+                with open(temp_path, "wb") as blob_file:
+                    blob_file.write(content)
+                os.replace(temp_path, blob_path)
+
+            previous = self.index.get(url)
+            now = time.time()
+            self.index[url] = {
+                "blob": digest,
+                "size": len(content),
+                "encoding": encoding,
+                "etag": headers.get("ETag"),
+                "last_modified": headers.get("Last-Modified"),
+                "fetched_at": now,
+                "last_access": now,
+            }
+            changed = previous is None or previous["blob"] != digest
+
+            # Isi halaman berubah, blob lama dihapus jika tidak dipakai url lain
+            if previous is not None and changed:
+                self._remove_unused_blob(previous["blob"])
+            return changed
+
+    def _remove_unused_blob(self, digest):
+        # Dipanggil di dalam lock
+        if all(entry["blob"] != digest for entry in self.index.values()):
+            if os.path.exists(self._blob_path(digest)):
+                os.remove(self._blob_path(digest))
+
+    def _remove_orphan_blobs(self):
+        # Blob yang tidak ada di index (misalnya sisa versi halaman lama) ikut dihapus agar ukuran cache tetap terbatas
+        used = {entry["blob"] for entry in self.index.values()}
+        for name in os.listdir(self.blob_dir):
+            if name not in used and not name.endswith(".tmp"):
+                os.remove(self._blob_path(name))
+
+    def evict(self):
+        """
+        Menghapus blob yang tidak dipakai lagi, lalu entry yang paling lama tidak diakses
+        sampai total ukuran blob <= max_bytes.
+        """
+        with self.lock:
+            self._remove_orphan_blobs()
+            blobs = {entry["blob"]: entry["size"] for entry in self.index.values()}
+            total_bytes = sum(blobs.values())
+
+            for url, entry in sorted(self.index.items(), key=lambda item: item[1]["last_access"]):
+                if total_bytes <= self.max_bytes:
+                    break
+                del self.index[url]
+
+                # Blob bisa dipakai oleh lebih dari satu url, hanya dihapus jika tidak dipakai lagi
+                if all(other["blob"] != entry["blob"] for other in self.index.values()):
+                    total_bytes -= blobs[entry["blob"]]
+                    self._remove_unused_blob(entry["blob"])
+
+    def flush(self):
+        # Menjalankan eviction lalu menulis index secara atomic
+        self.evict()
+        with self.lock:
+            temp_path = f"{self.index_path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as index_file:
+                json.dump(self.index, index_file)
+            os.replace(temp_path, self.index_path)
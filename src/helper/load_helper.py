@@ -0,0 +1,209 @@
+import csv
+from io import StringIO
+
+from sqlalchemy import MetaData, Table, and_, bindparam, inspect
+
+LOAD_METHODS = ["copy", "insert"]
+
+
+def psql_insert_copy(table, conn, keys, data_iter):
+    """
+    Function yang digunakan sebagai `method` pada DataFrame.to_sql untuk
+    memasukkan data memakai COPY FROM STDIN (jauh lebih cepat daripada INSERT per baris).
+    Data ditulis ke buffer CSV di memory lalu di-stream ke PostgreSQL.
+    """
+    preparer = conn.dialect.identifier_preparer
+    table_name = preparer.format_table(table.table)
+    columns = ", ".join(preparer.quote(key) for key in keys)
+
+    buffer = StringIO()
+    csv.writer(buffer).writerows(data_iter)
+    buffer.seek(0)
+
+    dbapi_conn = conn.connection
+    with dbapi_conn.cursor() as cursor:
+        cursor.copy_expert(f"COPY {table_name} ({columns}) FROM STDIN WITH CSV", buffer)
+
+
+def supports_copy(engine):
+    # COPY FROM STDIN hanya tersedia di PostgreSQL (psycopg2)
+    return engine.dialect.name == "postgresql"
+
+
+def load_dataframe(data, table_name, engine, if_exists="append", method="copy", chunksize=100000):
+    """
+    Function yang digunakan untuk load DataFrame ke database dalam satu transaksi per tabel.
+    method="copy" memakai COPY FROM STDIN dan otomatis kembali ke INSERT biasa
+    (DataFrame.to_sql) jika database tidak mendukung COPY atau COPY gagal.
+    """
+    if method not in LOAD_METHODS:
+        raise ValueError(f"Unknown load method {method}, expected one of {LOAD_METHODS}")
+
+    if method == "copy" and not supports_copy(engine):
+        print(f"COPY is not supported by {engine.dialect.name}, loading {table_name} with INSERT")
+        method = "insert"
+
+    if method == "copy":
+        try:
+            with engine.begin() as conn:
+                data.to_sql(table_name, con=conn, if_exists=if_exists, index=False,
+                            method=psql_insert_copy, chunksize=chunksize)
+            return method
+        except Exception as error:
+            # Transaksi sudah di-rollback, ulangi dengan cara lama
+            print(f"COPY into {table_name} failed ({error}), falling back to INSERT")
+            method = "insert"
+
+    with engine.begin() as conn:
+        data.to_sql(table_name, con=conn, if_exists=if_exists, index=False, chunksize=chunksize)
+    return method
+
+
+LOAD_MODES = ["default", "upsert"]
+
+# Natural key setiap tabel yang dipakai untuk upsert
+UPSERT_KEYS = {
+    "AmazonData": ["link", "main_category", "sub_category"],
+    # Satu produk bisa dilihat di beberapa merchant dan harga pada tanggal yang sama
+    "ProductData": ["ID", "DateSeen", "Merchant", "MinPrice", "MaxPrice", "Condition", "isSale"],
+    "MydramalistData": ["profile_link", "review_date"],
+}
+
+
+def _ensure_upsert_table(data, table_name, keys, conn):
+    preparer = conn.dialect.identifier_preparer
+    quoted_table = preparer.quote(table_name)
+    key_columns = ", ".join(preparer.quote(key) for key in keys)
+
+    # Membuat tabel tujuan (tanpa data) jika belum ada
+    if not inspect(conn).has_table(table_name):
+        data.head(0).to_sql(table_name, con=conn, index=False)
+
+    # ON CONFLICT membutuhkan unique index pada natural key.
+    # Jika tabel lama sudah berisi duplikat, index ini gagal dibuat dan duplikat harus dibersihkan dulu
+    index_name = f"{table_name}_upsert_key"
+    existing = {index["name"]: index["column_names"] for index in inspect(conn).get_indexes(table_name)}
+    if index_name in existing and existing[index_name] != list(keys):
+        # Natural key berubah, unique index lama diganti
+        conn.exec_driver_sql(f"DROP INDEX {preparer.quote(index_name)}")
+    conn.exec_driver_sql(
+        f"CREATE UNIQUE INDEX IF NOT EXISTS {preparer.quote(index_name)} ON {quoted_table} ({key_columns})"
+    )
+
+
+def _unique_rows(data, table_name, keys):
+    # Baris yang identik di semua kolom cukup di-load sekali. Baris dengan key sama tetapi isi berbeda
+    # berarti key tidak unik, sehingga load dihentikan daripada memilih salah satu baris dan membuang sisanya
+    identical = data.duplicated()
+    if identical.any():
+        print(f"{identical.sum()} identical rows in {table_name} are loaded once")
+        data = data[~identical]
+
+    conflicting = data.duplicated(subset=keys, keep=False)
+    if conflicting.any():
+        example = data.loc[conflicting, keys].drop_duplicates().head(3).to_dict(orient="records")
+        raise ValueError(
+            f"Upsert keys {keys} are not unique in {table_name}: {conflicting.sum()} rows share a key "
+            f"with different values, e.g. {example}"
+        )
+    return data
+
+
+def _replace_null_key_rows(data, table_name, keys, conn):
+    """
+    Unique index menganggap NULL selalu berbeda, sehingga ON CONFLICT tidak pernah terjadi untuk baris
+    dengan key kosong. Baris lama dengan key yang sama (dibandingkan null-safe, IS NOT DISTINCT FROM)
+    dihapus dulu agar baris baru yang di-insert tidak menjadi duplikat saat rerun.
+    Mengembalikan mask baris yang memiliki key kosong.
+    """
+    null_keys = data[keys].isnull().any(axis=1)
+    if null_keys.any():
+        table = Table(table_name, MetaData(), autoload_with=conn)
+        statement = table.delete().where(and_(*(
+            table.c[key].is_not_distinct_from(bindparam(f"key_{idx}")) for idx, key in enumerate(keys)
+        )))
+        values = data.loc[null_keys, keys].astype(object)
+        values = values.where(values.notna(), None)
+        conn.execute(statement, [
+            {f"key_{idx}": value for idx, value in enumerate(row)} for row in values.itertuples(index=False)
+        ])
+    return null_keys
+
+
+def _postgres_upsert(data, table_name, keys, engine):
+    with engine.begin() as conn:
+        _ensure_upsert_table(data, table_name, keys, conn)
+        # Baris dengan key kosong tidak pernah konflik, sehingga ikut di-insert dari staging table di bawah
+        _replace_null_key_rows(data, table_name, keys, conn)
+
+        preparer = conn.dialect.identifier_preparer
+        quoted_table = preparer.quote(table_name)
+        staging_table = preparer.quote(f"staging_{table_name}")
+        columns = [preparer.quote(col) for col in data.columns]
+        key_columns = [preparer.quote(key) for key in keys]
+        update_columns = [col for col in columns if col not in key_columns]
+
+        # Bulk load ke staging table sementara memakai COPY
+        conn.exec_driver_sql(
+            f"CREATE TEMP TABLE {staging_table} (LIKE {quoted_table} INCLUDING DEFAULTS) ON COMMIT DROP"
+        )
+        buffer = StringIO()
+        data.to_csv(buffer, index=False, header=False)
+        buffer.seek(0)
+        with conn.connection.cursor() as cursor:
+            cursor.copy_expert(f"COPY {staging_table} ({', '.join(columns)}) FROM STDIN WITH CSV", buffer)
+
+        # Merge staging ke tabel tujuan, baris yang tidak berubah tidak disentuh
+        if update_columns:
+            conflict_action = (
+                f"DO UPDATE SET {', '.join(f'{col} = EXCLUDED.{col}' for col in update_columns)} "
+                f"WHERE ({', '.join(f'{quoted_table}.{col}' for col in update_columns)}) "
+                f"IS DISTINCT FROM ({', '.join(f'EXCLUDED.{col}' for col in update_columns)})"
+            )
+        else:
+            conflict_action = "DO NOTHING"
+
+        result = conn.exec_driver_sql(
+            f"INSERT INTO {quoted_table} ({', '.join(columns)}) "
+            f"SELECT {', '.join(columns)} FROM {staging_table} "
+            f"ON CONFLICT ({', '.join(key_columns)}) {conflict_action}"
+        )
+        return result.rowcount
+
+
+def _pangres_upsert(data, table_name, keys, engine):
+    from pangres import upsert
+
+    with engine.begin() as conn:
+        # Unique index dibuat dengan cara yang sama seperti di PostgreSQL, karena tabel yang dibuat
+        # load mode default tidak memiliki primary key yang dibutuhkan pangres
+        _ensure_upsert_table(data, table_name, keys, conn)
+
+        # pangres tidak menerima key yang kosong, baris tersebut menggantikan baris lama dengan key yang sama
+        null_keys = _replace_null_key_rows(data, table_name, keys, conn)
+        if null_keys.any():
+            data[null_keys].to_sql(table_name, con=conn, if_exists="append", index=False)
+
+        keyed_data = data[~null_keys].set_index(keys)
+        upsert(con=conn, df=keyed_data, table_name=table_name, if_row_exists="update", create_table=False)
+    return len(data)
+
+
+def upsert_dataframe(data, table_name, engine, keys=None):
+    """
+    Function yang digunakan untuk load DataFrame secara idempotent (upsert) berdasarkan natural key.
+    Di PostgreSQL data di-COPY ke staging table lalu di-merge dengan INSERT ... ON CONFLICT
+    dalam satu transaksi, sehingga rerun hanya mengubah baris yang berbeda.
+    Database lain memakai pangres sebagai fallback. Baris dengan key kosong menggantikan baris lama
+    dengan key yang sama (dibandingkan null-safe), sehingga rerun tetap idempotent.
+    ValueError dilempar jika beberapa baris memiliki key yang sama tetapi isi yang berbeda.
+    """
+    keys = keys or UPSERT_KEYS[table_name]
+    missing_keys = [key for key in keys if key not in data.columns]
+    if missing_keys:
+        raise ValueError(f"Upsert keys {missing_keys} are not columns of {table_name}")
+    data = _unique_rows(data, table_name, keys)
+
+    if supports_copy(engine):
+        return _postgres_upsert(data, table_name, keys, engine)
+    return _pangres_upsert(data, table_name, keys, engine)
@@ -0,0 +1,171 @@
+import os
+import sys
+import threading
+import time
+import resource
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+def peak_memory_mb():
+    """
+    Function yang digunakan untuk mengambil peak memory (max RSS)
+    dari proses yang sedang berjalan dalam satuan MB.
+    Linux mengembalikan ru_maxrss dalam KB, sedangkan macOS dalam byte.
+    """
+    return _max_rss_mb(resource.RUSAGE_SELF)
+
+
+def _max_rss_mb(who):
+    max_rss = resource.getrusage(who).ru_maxrss
+    if sys.platform == "darwin":
+        return max_rss / (1024 * 1024)
+    return max_rss / 1024
+
+
+def peak_memory_with_children_mb():
+    """
+    Function yang digunakan untuk mengambil peak memory (max RSS) terbesar antara proses ini
+    dan proses anak yang sudah selesai (misalnya worker ProcessPoolExecutor) dalam satuan MB.
+    """
+    return max(_max_rss_mb(resource.RUSAGE_SELF), _max_rss_mb(resource.RUSAGE_CHILDREN))
+
+
+def _proc_rss_bytes(pid):
+    # Field kedua /proc/<pid>/statm adalah jumlah page yang sedang berada di memory (RSS)
+    with open(f"/proc/{pid}/statm", encoding="ascii") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def _proc_children(pid):
+    children = []
+    for thread in os.listdir(f"/proc/{pid}/task"):
+        try:
+            with open(f"/proc/{pid}/task/{thread}/children", encoding="ascii") as children_file:
+                children += [int(child) for child in children_file.read().split()]
+        except OSError:
+            continue
+    return children
+
+
+def current_memory_mb():
+    """
+    Function yang digunakan untuk mengambil RSS saat ini (bukan peak) dari proses ini ditambah
+    proses anak yang masih berjalan (misalnya worker transform paralel) dalam satuan MB.
+    Memakai psutil jika terinstall, /proc di Linux, dan mengembalikan None jika keduanya tidak tersedia.
+    """
+    if psutil is not None:
+        process = psutil.Process()
+        processes = [process] + process.children(recursive=True)
+        total = 0
+        for item in processes:
+            try:
+                total += item.memory_info().rss
+            except psutil.Error:
+                continue
+        return total / (1024 * 1024)
+
+    if not os.path.exists("/proc/self/statm"):
+        return None
+    pids, total = [os.getpid()], 0
+    while pids:
+        pid = pids.pop()
+        try:
+            total += _proc_rss_bytes(pid)
+            pids += _proc_children(pid)
+        except OSError:
+            # Proses anak sudah selesai saat dibaca
+            continue
+    return total / (1024 * 1024)
+
+
+class MemorySampler:
+    """
+    Class untuk mengukur peak memory selama satu bagian pekerjaan (misalnya satu task) berjalan.
+    RSS saat ini diambil ketika start() dipanggil sebagai baseline lalu disampel setiap `interval` detik
+    di thread terpisah, sehingga peak tidak tercampur dengan pekerjaan sebelumnya di proses yang sama
+    (berbeda dengan max RSS yang merupakan high-water mark seluruh umur proses).
+    Jika RSS saat ini tidak bisa dibaca, peak_mb() kembali memakai max RSS proses.
+    """
+
+    def __init__(self, interval=0.1):
+        self.interval = interval
+        self.start_mb = None
+        self.peak = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        current = current_memory_mb()
+        if current is not None:
+            self.peak = max(self.peak or 0.0, current)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self):
+        self.start_mb = current_memory_mb()
+        self.peak = self.start_mb
+        if self.start_mb is not None:
+            self._thread = threading.Thread(target=self._run, name="memory-sampler", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._sample()
+
+    def peak_mb(self):
+        return self.peak if self.peak is not None else peak_memory_with_children_mb()
+
+
+def cpu_seconds():
+    """
+    Function yang digunakan untuk mengambil total CPU time (user + system) proses ini
+    ditambah proses anak yang sudah selesai, dalam detik.
+    """
+    total = 0.0
+    for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN):
+        usage = resource.getrusage(who)
+        total += usage.ru_utime + usage.ru_stime
+    return total
+
+
+class ThroughputMeter:
+    """
+    Class sederhana untuk menghitung jumlah baris (atau unit lain, misalnya pages)
+    yang diproses, throughput per detik, dan peak memory selama satu proses berjalan.
+    """
+
+    def __init__(self, label, unit="rows"):
+        self.label = label
+        self.unit = unit
+        self.rows = 0
+        self.batches = 0
+        self.start_time = time.perf_counter()
+
+    def add(self, rows):
+        self.rows += rows
+        self.batches += 1
+
+    def elapsed(self):
+        return time.perf_counter() - self.start_time
+
+    def rows_per_sec(self):
+        elapsed = self.elapsed()
+        return self.rows / elapsed if elapsed > 0 else 0.0
+
+    def report(self):
+        # Menampilkan ringkasan throughput ke stdout (masuk ke log/load_data.log)
+        print(
+            f"[{self.label}] {self.rows} {self.unit} in {self.batches} batches, "
+            f"{self.elapsed():.2f}s, {self.rows_per_sec():.1f} {self.unit}/sec, "
+            f"peak memory {peak_memory_mb():.1f} MB"
+        )
@@ -0,0 +1,149 @@
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+
+# Tipe kolom yang nilai min/max-nya dihitung
+COMPARABLE_DTYPES = ["number", "datetime", "datetimetz", "bool"]
+
+
+def _json_value(value):
+    # Mengubah nilai numpy/pandas menjadi tipe yang bisa disimpan di JSON
+    if value is None or pd.isna(value):
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if hasattr(value, "item"):
+        return value.item()
+    return value
+
+
+def _distinct_hashes(values):
+    # Hash 64-bit setiap nilai unik, jauh lebih kecil daripada menyimpan nilainya.
+    # Angka disamakan ke float64 agar 5 dan 5.0 dari potongan csv yang berbeda tipe dihitung sekali
+    values = values.dropna()
+    if is_numeric_dtype(values) and not is_bool_dtype(values):
+        values = values.astype("float64")
+    return np.unique(pd.util.hash_pandas_object(values, index=False).to_numpy())
+
+
+def _common_dtype(left, right):
+    # Tipe kolom gabungan dua potongan, mengikuti hasil pd.concat (misalnya int64 + float64 = float64)
+    if str(left) == str(right):
+        return left
+    try:
+        return np.result_type(left, right)
+    except TypeError:
+        return np.dtype(object)
+
+
+def _combine(values, pick):
+    # Mengambil min/max dari hasil setiap potongan, potongan yang kosong diabaikan
+    values = [value for value in values if not pd.isna(value)]
+    if not values:
+        return np.nan
+    try:
+        return pick(values)
+    except TypeError:
+        return np.nan
+
+
+def profile_chunks(chunks, total_rows=None, sample_rows=0, seed=0):
+    """
+    Function yang digunakan untuk membuat profil kualitas data dari DataFrame yang dibaca per potongan:
+    tipe data, jumlah dan persentase nilai kosong, jumlah nilai unik, serta min/max
+    (untuk kolom angka, tanggal, dan boolean). Statistik setiap potongan dihitung vectorized untuk
+    seluruh kolom lalu digabung, sehingga data tidak perlu dimuat sekaligus.
+    Jumlah nilai unik dihitung dari hash 64-bit setiap nilai.
+    Jika sample_rows > 0 dan total_rows lebih besar, setiap potongan disampel acak dengan proporsi
+    sample_rows / total_rows sehingga profil dihitung dari sekitar sample_rows baris.
+    """
+    fraction = sample_rows / total_rows if sample_rows and total_rows and total_rows > sample_rows else None
+    random_state = np.random.default_rng(seed)
+
+    rows, profiled_rows = 0, 0
+    dtypes, missing, distinct, minimums, maximums = {}, None, {}, [], []
+    for chunk in chunks:
+        rows += len(chunk)
+        if fraction is not None:
+            chunk = chunk.sample(frac=fraction, random_state=random_state)
+        profiled_rows += len(chunk)
+
+        for column, dtype in chunk.dtypes.items():
+            dtypes[column] = _common_dtype(dtypes[column], dtype) if column in dtypes else dtype
+            distinct[column] = np.union1d(distinct.get(column, []), _distinct_hashes(chunk[column]))
+        chunk_missing = chunk.isna().sum()
+        missing = chunk_missing if missing is None else missing.add(chunk_missing, fill_value=0)
+
+        comparable = chunk.select_dtypes(include=COMPARABLE_DTYPES)
+        minimums.append(comparable.min())
+        maximums.append(comparable.max())
+
+    columns = pd.Index(list(dtypes))
+    missing = missing.reindex(columns) if missing is not None else pd.Series(0, index=columns)
+    # Min/max hanya untuk kolom yang bisa dibandingkan di semua potongan
+    comparable_columns = set.intersection(*[set(values.index) for values in minimums]) if minimums else set()
+
+    profile = pd.DataFrame({
+        "dtype": pd.Series({column: str(dtype) for column, dtype in dtypes.items()}, dtype=object),
+        "missing": missing.astype("int64"),
+        "missing_pct": (missing * 100 / profiled_rows) if profiled_rows else 0.0,
+        "distinct": pd.Series({column: len(hashes) for column, hashes in distinct.items()}, dtype="int64"),
+        "min": pd.Series({
+            column: _combine([values.get(column) for values in minimums], min) if column in comparable_columns else np.nan
+            for column in columns
+        }, dtype=object),
+        "max": pd.Series({
+            column: _combine([values.get(column) for values in maximums], max) if column in comparable_columns else np.nan
+            for column in columns
+        }, dtype=object),
+    }, index=columns)
+
+    # Jumlah baris yang dibaca dan yang benar-benar diprofil (lebih kecil dari data asli jika memakai sampel)
+    profile.attrs["rows"] = rows
+    profile.attrs["profiled_rows"] = profiled_rows
+    return profile
+
+
+def profile_frame(data, sample_rows=0, seed=0):
+    """
+    Function yang digunakan untuk membuat profil kualitas data dari DataFrame yang sudah ada di memory,
+    sama seperti profile_chunks dengan satu potongan.
+    """
+    return profile_chunks([data], total_rows=len(data), sample_rows=sample_rows, seed=seed)
+
+
+def check_thresholds(profile, max_missing_pct=100.0, column_max_missing_pct=None):
+    """
+    Function yang digunakan untuk membandingkan profil dengan batas persentase nilai kosong.
+    column_max_missing_pct berisi batas khusus per kolom yang menggantikan max_missing_pct.
+    Mengembalikan list pelanggaran, kosong jika semua kolom lolos.
+    """
+    limits = pd.Series(float(max_missing_pct), index=profile.index)
+    for column, limit in (column_max_missing_pct or {}).items():
+        if column in limits.index:
+            limits[column] = float(limit)
+
+    failed = profile["missing_pct"] > limits
+    return [
+        {"column": column, "missing_pct": round(float(profile.at[column, "missing_pct"]), 4),
+         "max_missing_pct": limits[column]}
+        for column in profile.index[failed]
+    ]
+
+
+def build_report(dataset, profile, rows, violations):
+    """
+    Function yang digunakan untuk menyusun laporan kualitas data dalam bentuk dict
+    yang siap disimpan sebagai JSON.
+    """
+    return {
+        "dataset": dataset,
+        "rows": int(rows),
+        "profiled_rows": int(profile.attrs.get("profiled_rows", rows)),
+        "columns": [
+            {"column": str(column), **{key: _json_value(value) for key, value in stats.items()}}
+            for column, stats in profile.to_dict(orient="index").items()
+        ],
+        "violations": violations,
+        "passed": not violations,
+    }
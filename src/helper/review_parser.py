@@ -0,0 +1,142 @@
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+
+PARSER_BACKENDS = ["auto", "lxml", "soup"]
+
+# Nilai pengganti jika sebuah field tidak ditemukan pada review
+DEFAULT_PLACEHOLDERS = {
+    'reviewer': "Unknown",
+    'profile_link': "No Profile Link",
+    'review_date': "No Date",
+    'helpful_count': "0",
+    'overall_rating': "0",
+    'review_body': "No Review Available",
+    'read_more': " (Full Review Not Available)",
+}
+
+# Pasangan (tag, class) untuk setiap field review
+FIELD_SELECTORS = {
+    'reviewer': ('a', 'text-primary'),
+    'review_date': ('small', 'datetime'),
+    'user_stats': ('div', 'user-stats'),
+    'overall_rating': ('span', 'score'),
+    'review_body': ('div', 'review-body'),
+    'read_more': ('p', 'read-more'),
+}
+
+
+def resolve_backend(backend):
+    if backend == "auto":
+        return "lxml" if lxml is not None else "soup"
+    if backend == "lxml" and lxml is None:
+        raise ImportError("Parser backend 'lxml' requires the lxml package")
+    return backend
+
+
+def _build_review(found, text_of, href_of, helpful_of, placeholders):
+    # Menyusun satu review dari elemen yang ditemukan, sama seperti parsing versi awal
+    reviewer_tag = found.get('reviewer')
+    body_tag = found.get('review_body')
+
+    if body_tag is not None:
+        review_body = text_of(body_tag).strip().replace('\n', ' ')
+    else:
+        review_body = placeholders['review_body']
+    if 'read_more' in found:
+        review_body += placeholders['read_more']
+
+    return {
+        'reviewer': text_of(reviewer_tag).strip() if reviewer_tag is not None else placeholders['reviewer'],
+        'profile_link': href_of(reviewer_tag) if reviewer_tag is not None else placeholders['profile_link'],
+        'review_date': text_of(found['review_date']).strip() if 'review_date' in found else placeholders['review_date'],
+        'helpful_count': helpful_of(found['user_stats']) if 'user_stats' in found else placeholders['helpful_count'],
+        'overall_rating': text_of(found['overall_rating']).strip() if 'overall_rating' in found else placeholders['overall_rating'],
+        'review_body': review_body,
+    }
+
+
+def _match_fields(elements):
+    # Satu kali iterasi elemen (tag, classes, element) di dalam review,
+    # menyimpan elemen pertama yang cocok untuk setiap field
+    found = {}
+    for tag_name, classes, element in elements:
+        if not classes:
+            continue
+        for field, (tag, css_class) in FIELD_SELECTORS.items():
+            if field not in found and tag_name == tag and css_class in classes:
+                found[field] = element
+        if len(found) == len(FIELD_SELECTORS):
+            break
+    return found
+
+
+def _has_review_class(css_class):
+    # Saat parsing, atribut class dapat berupa string "review x" atau list
+    if not css_class:
+        return False
+    classes = css_class.split() if isinstance(css_class, str) else css_class
+    return 'review' in classes
+
+
+def _parse_soup(html, placeholders):
+    # SoupStrainer membuat BeautifulSoup hanya membangun tree untuk div review
+    soup = BeautifulSoup(html, 'html.parser', parse_only=SoupStrainer('div', class_=_has_review_class))
+    reviews_data = []
+
+    for review in soup.find_all('div', class_='review'):
+        found = _match_fields(
+            (tag.name, tag.get('class'), tag) for tag in review.descendants if getattr(tag, 'name', None)
+        )
+        reviews_data.append(_build_review(
+            found,
+            text_of=lambda tag: tag.text,
+            href_of=lambda tag: tag['href'],
+            helpful_of=lambda tag: tag.find('b').text.strip(),
+            placeholders=placeholders,
+        ))
+
+    return reviews_data
+
+
+def _parse_lxml(html, placeholders):
+    try:
+        root = lxml.html.fromstring(html)
+    except ValueError:
+        # lxml menolak string unicode yang memiliki deklarasi encoding XML
+        root = lxml.html.fromstring(html.encode('utf-8'))
+    reviews_data = []
+
+    for review in root.iter('div'):
+        if 'review' not in review.get('class', '').split():
+            continue
+
+        found = _match_fields(
+            (element.tag, element.get('class', '').split(), element)
+            for element in review.iterdescendants() if isinstance(element.tag, str)
+        )
+        reviews_data.append(_build_review(
+            found,
+            text_of=lambda element: element.text_content(),
+            href_of=lambda element: element.get('href'),
+            helpful_of=lambda element: next(element.iter('b')).text_content().strip(),
+            placeholders=placeholders,
+        ))
+
+    return reviews_data
+
+
+def parse_reviews(html, backend="auto", placeholders=None):
+    """
+    Function yang digunakan untuk mengambil data review dari HTML halaman review MyDramalist.
+    Setiap elemen review cukup ditelusuri satu kali untuk keenam field.
+    backend "lxml" memakai parser C dari lxml, "soup" memakai BeautifulSoup + SoupStrainer,
+    dan "auto" memilih lxml jika terinstall.
+    """
+    placeholders = {**DEFAULT_PLACEHOLDERS, **(placeholders or {})}
+    if resolve_backend(backend) == "lxml":
+        return _parse_lxml(html, placeholders)
+    return _parse_soup(html, placeholders)
@@ -0,0 +1,269 @@
+"""
+Run report pipeline: setiap task mencatat wall time, CPU time, peak RSS, jumlah baris, dan ukuran file
+input/output ke file JSON lines, dan opsional ke file textfile Prometheus (node_exporter).
+
+Membandingkan dua run untuk mencari stage yang melambat:
+    python -m src.helper.run_report log/run_report_lama.jsonl log/run_report.jsonl
+
+Jika kedua file sama (atau hanya satu file diberikan), run terakhir dibandingkan dengan run sebelumnya.
+"""
+import argparse
+import datetime
+import glob
+import json
+import os
+import time
+import uuid
+
+import luigi
+from luigi.task import flatten
+
+from src.helper.metrics_helper import MemorySampler, cpu_seconds
+
+# Id run dibuat sekali di proses utama lalu disimpan di environment, sehingga ikut diwarisi
+# proses worker Luigi (baik hasil fork maupun spawn)
+DEFAULT_RUN_ID = os.environ.setdefault(
+    "ETL_RUN_ID", datetime.datetime.now().strftime("%Y%m%dT%H%M%S") + "-" + uuid.uuid4().hex[:6]
+)
+
+# Direktori log berada di samping ETL_DATA_DIR (<ETL_DATA_DIR>/../log) atau diarahkan sendiri melalui ETL_LOG_DIR
+LOG_DIR = os.getenv("ETL_LOG_DIR") or os.path.join(
+    os.path.dirname(os.path.abspath(os.getenv("ETL_DATA_DIR", "/Users/user/data-eng/data"))), "log"
+)
+
+# Metric Prometheus yang ditulis untuk setiap task: (nama field di report, nama metric, faktor skala, help)
+PROMETHEUS_METRICS = [
+    ("wall_seconds", "etl_task_wall_seconds", 1, "Wall time task"),
+    ("cpu_seconds", "etl_task_cpu_seconds", 1, "CPU time task (user + system, termasuk proses anak)"),
+    ("peak_rss_mb", "etl_task_peak_rss_bytes", 1024 * 1024, "Peak RSS selama task berjalan (termasuk proses anak)"),
+    ("rss_growth_mb", "etl_task_rss_growth_bytes", 1024 * 1024, "Kenaikan peak RSS dibanding RSS saat task mulai"),
+    ("rows_in", "etl_task_rows_in", 1, "Jumlah baris input"),
+    ("rows_out", "etl_task_rows_out", 1, "Jumlah baris output"),
+    ("bytes_read", "etl_task_bytes_read", 1, "Ukuran file input"),
+    ("bytes_written", "etl_task_bytes_written", 1, "Ukuran file output"),
+]
+
+
+class RunReportConfig(luigi.Config):
+    enabled = luigi.BoolParameter(default=True)  # Mencatat metric setiap task ke run report
+    path = luigi.Parameter(default=os.path.join(LOG_DIR, "run_report.jsonl"))  # File JSON lines (append)
+    prometheus_path = luigi.OptionalParameter(default=None)  # File .prom untuk textfile collector node_exporter
+    run_id = luigi.Parameter(default=DEFAULT_RUN_ID)  # Id yang sama untuk semua task dalam satu run
+
+
+def _input_targets(task):
+    # Memakai deps() sehingga task dengan requires() yang mengembalikan None tetap bisa diproses
+    return flatten([dep.output() for dep in task.deps()])
+
+
+def _count_rows(targets):
+    # Jumlah baris hanya dihitung untuk target data antar stage (DataFrameTarget)
+    counted = [target for target in targets if hasattr(target, "count_rows") and target.exists()]
+    if not counted:
+        return None
+    return sum(target.count_rows() for target in counted)
+
+
+def _file_bytes(targets):
+    paths = [target.path for target in targets if getattr(target, "path", None) and os.path.isfile(target.path)]
+    if not paths:
+        return None
+    return sum(os.path.getsize(path) for path in paths)
+
+
+def start_task_metrics(task):
+    # RSS disampel selama task berjalan, karena max RSS proses ikut memuat peak task sebelumnya di worker yang sama
+    task._run_report_start = (time.time(), time.perf_counter(), cpu_seconds(), MemorySampler().start())
+
+
+def _task_record(task, status, error=None):
+    started_at, start_time, start_cpu, memory = task._run_report_start
+    memory.stop()
+    inputs = _input_targets(task)
+    outputs = flatten(task.output()) if status == "success" else []
+    return {
+        "run_id": RunReportConfig().run_id,
+        "task_id": task.task_id,
+        "task_family": task.task_family,
+        "params": task.to_str_params(only_significant=True),
+        "status": status,
+        "started_at": datetime.datetime.fromtimestamp(started_at).isoformat(timespec="seconds"),
+        "wall_seconds": round(time.perf_counter() - start_time, 4),
+        "cpu_seconds": round(cpu_seconds() - start_cpu, 4),
+        "start_rss_mb": round(memory.start_mb, 1) if memory.start_mb is not None else None,
+        "peak_rss_mb": round(memory.peak_mb(), 1),
+        # Memory yang dipakai task ini sendiri, RSS proses worker tidak turun walaupun task sebelumnya sudah selesai
+        "rss_growth_mb": round(memory.peak_mb() - memory.start_mb, 1) if memory.start_mb is not None else None,
+        "rows_in": _count_rows(inputs),
+        "rows_out": _count_rows(outputs),
+        "bytes_read": _file_bytes(inputs),
+        "bytes_written": _file_bytes(outputs),
+        "pid": os.getpid(),
+        "error": repr(error) if error is not None else None,
+    }
+
+
+def _finish_task_metrics(task, status, error=None):
+    config = RunReportConfig()
+    if not config.enabled or not hasattr(task, "_run_report_start"):
+        return
+
+    record = _task_record(task, status, error)
+    os.makedirs(os.path.dirname(os.path.abspath(config.path)), exist_ok=True)
+    # Satu write per baris dengan mode append, sehingga beberapa proses worker dapat menulis ke file yang sama
+    with open(config.path, "a", encoding="utf-8") as report_file:
+        report_file.write(json.dumps(record) + "\n")
+
+    if config.prometheus_path:
+        write_prometheus(_current_run_records(config, record), config.prometheus_path)
+
+
+def _current_run_records(config, record):
+    """
+    Record run ini juga ditulis ke file kecil per run_id di samping file .prom, sehingga file .prom
+    dapat ditulis ulang tanpa membaca seluruh run report yang terus bertambah.
+    File dipakai bersama oleh semua proses worker dalam run yang sama (append per baris),
+    dan file milik run sebelumnya dihapus.
+    """
+    records_path = f"{config.prometheus_path}.{config.run_id}.jsonl"
+    if not os.path.exists(records_path):
+        for old_path in glob.glob(f"{glob.escape(config.prometheus_path)}.*.jsonl"):
+            os.remove(old_path)
+    with open(records_path, "a", encoding="utf-8") as records_file:
+        records_file.write(json.dumps(record) + "\n")
+    return load_runs(records_path).get(config.run_id, [])
+
+
+def success_task_metrics(task):
+    _finish_task_metrics(task, "success")
+
+
+def failure_task_metrics(task, error):
+    _finish_task_metrics(task, "failure", error)
+
+
+def register_task_metrics(task_class=luigi.Task):
+    """
+    Function yang digunakan untuk memasang event handler START/SUCCESS/FAILURE pada task_class
+    (default semua task Luigi) sehingga setiap task yang dijalankan tercatat di run report.
+    """
+    task_class.event_handler(luigi.Event.START)(start_task_metrics)
+    task_class.event_handler(luigi.Event.SUCCESS)(success_task_metrics)
+    task_class.event_handler(luigi.Event.FAILURE)(failure_task_metrics)
+
+
+def load_runs(path):
+    """
+    Function yang digunakan untuk membaca run report JSON lines dan mengelompokkan record per run_id
+    sesuai urutan run di dalam file.
+    """
+    runs = {}
+    with open(path, encoding="utf-8") as report_file:
+        for line in report_file:
+            if line.strip():
+                record = json.loads(line)
+                runs.setdefault(record["run_id"], []).append(record)
+    return runs
+
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def write_prometheus(records, path):
+    """
+    Function yang digunakan untuk menulis metric task satu run dalam format textfile Prometheus.
+    File ditulis ke temporary file lalu di-rename agar node_exporter tidak membaca file setengah tertulis.
+    """
+    lines = ["# HELP etl_run_info Run pipeline yang metric-nya ada di file ini", "# TYPE etl_run_info gauge"]
+    lines += [f'etl_run_info{{run_id="{_escape_label(run_id)}"}} 1' for run_id in dict.fromkeys(r["run_id"] for r in records)]
+    for field, name, scale, help_text in PROMETHEUS_METRICS:
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge"]
+        for record in records:
+            if record.get(field) is not None:
+                labels = (f'task="{_escape_label(record["task_family"])}",task_id="{_escape_label(record["task_id"])}",'
+                          f'status="{record["status"]}"')
+                lines.append(f"{name}{{{labels}}} {record[field] * scale:g}")
+
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as prom_file:
+        prom_file.write("\n".join(lines) + "\n")
+    os.replace(temp_path, path)
+
+
+def _select_run(runs, run_id, offset):
+    if run_id:
+        return run_id, runs[run_id]
+    run_ids = list(runs)
+    if len(run_ids) < offset:
+        raise ValueError(f"Run report only contains {len(run_ids)} run(s)")
+    return run_ids[-offset], runs[run_ids[-offset]]
+
+
+def diff_runs(old_records, new_records):
+    """
+    Function yang digunakan untuk membandingkan metric setiap task pada dua run.
+    Hasil diurutkan dari task dengan kenaikan wall time terbesar.
+    """
+    old_by_task = {record["task_id"]: record for record in old_records}
+    new_by_task = {record["task_id"]: record for record in new_records}
+    rows = []
+
+    for task_id in list(old_by_task) + [task_id for task_id in new_by_task if task_id not in old_by_task]:
+        old, new = old_by_task.get(task_id, {}), new_by_task.get(task_id, {})
+        old_wall, new_wall = old.get("wall_seconds"), new.get("wall_seconds")
+        rows.append({
+            "task_id": task_id,
+            "old_wall_seconds": old_wall,
+            "new_wall_seconds": new_wall,
+            "delta_seconds": new_wall - old_wall if old_wall is not None and new_wall is not None else None,
+            "ratio": new_wall / old_wall if old_wall and new_wall is not None else None,
+            "old_peak_rss_mb": old.get("peak_rss_mb"),
+            "new_peak_rss_mb": new.get("peak_rss_mb"),
+            "old_rss_growth_mb": old.get("rss_growth_mb"),
+            "new_rss_growth_mb": new.get("rss_growth_mb"),
+            "old_rows_out": old.get("rows_out"),
+            "new_rows_out": new.get("rows_out"),
+        })
+
+    return sorted(rows, key=lambda row: row["delta_seconds"] if row["delta_seconds"] is not None else float("-inf"),
+                  reverse=True)
+
+
+def _cell(value, spec, width):
+    return format("-" if value is None else format(value, spec), f">{width}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("old", help="Run report lama (JSON lines)")
+    parser.add_argument("new", nargs="?", help="Run report baru, default sama dengan `old`")
+    parser.add_argument("--old-run-id", help="Run pada report lama, default run terakhir")
+    parser.add_argument("--new-run-id", help="Run pada report baru, default run terakhir")
+    args = parser.parse_args(argv)
+
+    new_path = args.new or args.old
+    same_file = os.path.abspath(new_path) == os.path.abspath(args.old)
+    new_runs = load_runs(new_path)
+    old_runs = new_runs if same_file else load_runs(args.old)
+
+    new_run_id, new_records = _select_run(new_runs, args.new_run_id, 1)
+    # Run terakhir dibandingkan dengan run sebelumnya jika keduanya berasal dari file yang sama
+    old_run_id, old_records = _select_run(old_runs, args.old_run_id, 2 if same_file and not args.new_run_id else 1)
+
+    print(f"old run: {old_run_id} ({sum(r['wall_seconds'] for r in old_records):.2f}s task time)")
+    print(f"new run: {new_run_id} ({sum(r['wall_seconds'] for r in new_records):.2f}s task time)")
+    print(f"{'task':<60} {'old s':>9} {'new s':>9} {'delta s':>9} {'ratio':>7} "
+          f"{'old MB':>8} {'new MB':>8} {'old +MB':>8} {'new +MB':>8} {'old rows':>10} {'new rows':>10}")
+    for row in diff_runs(old_records, new_records):
+        print(" ".join([
+            f"{row['task_id'][:60]:<60}",
+            _cell(row["old_wall_seconds"], ".2f", 9), _cell(row["new_wall_seconds"], ".2f", 9),
+            _cell(row["delta_seconds"], "+.2f", 9), _cell(row["ratio"], ".2f", 6) + ("x" if row["ratio"] is not None else " "),
+            _cell(row["old_peak_rss_mb"], ".1f", 8), _cell(row["new_peak_rss_mb"], ".1f", 8),
+            _cell(row["old_rss_growth_mb"], ".1f", 8), _cell(row["new_rss_growth_mb"], ".1f", 8),
+            _cell(row["old_rows_out"], "d", 10), _cell(row["new_rows_out"], "d", 10),
+        ]))
+
+if __name__ == "__main__":
+    main()
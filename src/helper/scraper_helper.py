@@ -1,68 +1,45 @@
-import requests  
-from bs4 import BeautifulSoup 
 import pandas as pd 
 import csv 
-from tqdm import tqdm 
+from src.helper.fetch_helper import PageFetcher
+from src.helper.http_cache import ResponseCache
+from src.helper.review_parser import parse_reviews as parse_review_html
 
-# Fungsi untuk mengambil ulasan 
-def scrape_reviews(page):
-    # URL halaman yang ingin diambil
-    url = f'https://mydramalist.com/18452-goblin/reviews?page={page}'
-    
-    # Melakukan permintaan GET untuk mengambil data dari URL
-    response = requests.get(url)
-    
-    # Mem-parsing HTML menggunakan BeautifulSoup
-    soup = BeautifulSoup(response.text, 'html.parser')
-
-    reviews_data = []
-
-    # Mencari semua elemen yang berisi review
-    for review in soup.find_all('div', class_='review'):
-        # Mengambil informasi reviewer
-        reviewer = review.find('a', class_='text-primary').text.strip() if review.find('a', class_='text-primary') else "Unknown"
-        profile_link = review.find('a', class_='text-primary')['href'] if review.find('a', class_='text-primary') else "No Profile Link"
-        
-        # Mengambil tanggal review
-        review_date = review.find('small', class_='datetime').text.strip() if review.find('small', class_='datetime') else "No Date"
-        
-        # Mengambil jumlah "helpful count"
-        helpful_count = review.find('div', class_='user-stats').find('b').text.strip() if review.find('div', class_='user-stats') else "0"
-        
-        # Mengambil rating 
-        overall_rating = review.find('span', class_='score').text.strip() if review.find('span', class_='score') else "0"
-
-        # Mengambil isi review
-        reviews_body = review.find('div', class_='review-body')
-        review_body = reviews_body.text.strip().replace('\n', ' ') if reviews_body else "No Review Body Available"
-
-        # Menangani review yang dipotong dengan "Read More"
-        read_more = review.find('p', class_='read-more')
-        if read_more:
-            review_body += " (Full review not accessible directly)"
+# Lokasi cache halaman review di disk
+CACHE_DIR = '.cache/mydramalist'
 
-        # Menyimpan data review ke dalam list
-        reviews_data.append({
-            'reviewer': reviewer,
-            'profile_link': profile_link,
-            'review_date': review_date,
-            'helpful_count': helpful_count,
-            'overall_rating': overall_rating,
-            'review_body': review_body 
-        })
+# Fungsi untuk membuat URL halaman review
+def page_url(page):
+    return f'https://mydramalist.com/18452-goblin/reviews?page={page}'
 
-    return reviews_data
-
-# Daftar untuk menyimpan semua review
-all_reviews = []
-
-# Mengambil review dari beberapa halaman dengan progress bar
-for page in tqdm(range(1, 46), desc="Scraping Pages"): 
-    reviews_on_page = scrape_reviews(page) 
-    all_reviews.extend(reviews_on_page)  
-
-# Mengonversi data review  menjadi DataFrame
-reviews_data = pd.DataFrame(all_reviews)
-
-# Menyimpan file ke CSV
-reviews_data.to_csv('goblin_reviews.csv', index=False, encoding='utf-8', quoting=csv.QUOTE_NONNUMERIC) 
\ No newline at end of file
+# Fungsi untuk mengambil ulasan 
+def scrape_reviews(page):
+    # Mengambil halaman (dari cache jika masih berlaku) lalu mem-parsing ulasan
+    with PageFetcher(cache=ResponseCache(CACHE_DIR)) as fetcher:
+        return parse_reviews(fetcher.fetch(page_url(page)))
+
+# Fungsi untuk mem-parsing ulasan dari halaman yang sudah diambil
+def parse_reviews(fetched_page):
+    # Mem-parsing HTML dengan parser tercepat yang tersedia (lxml atau BeautifulSoup)
+    return parse_review_html(fetched_page.text, placeholders={
+        'review_body': "No Review Body Available",
+        'read_more': " (Full review not accessible directly)",
+    })
+
+if __name__ == "__main__":
+    # Daftar untuk menyimpan semua review
+    all_reviews = []
+
+    # Mengambil review dari beberapa halaman secara concurrent dengan progress bar.
+    # Halaman yang tidak berubah sejak crawl sebelumnya diambil dari cache
+    with PageFetcher(cache=ResponseCache(CACHE_DIR)) as fetcher:
+        urls = [page_url(page) for page in range(1, 46)]
+        pages = fetcher.fetch_all(urls, parse_reviews, desc="Scraping Pages", stop_when_unchanged=True)
+
+    for reviews_on_page in pages:
+        all_reviews.extend(reviews_on_page)  
+
+    # Mengonversi data review  menjadi DataFrame
+    reviews_data = pd.DataFrame(all_reviews)
+
+    # Menyimpan file ke CSV
+    reviews_data.to_csv('goblin_reviews.csv', index=False, encoding='utf-8', quoting=csv.QUOTE_NONNUMERIC) 
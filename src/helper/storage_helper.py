@@ -0,0 +1,320 @@
+import os
+
+import luigi
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+STORAGE_FORMATS = ["auto", "parquet", "arrow", "csv"]
+
+FORMAT_EXTENSIONS = {
+    "parquet": ".parquet",
+    "arrow": ".arrow",
+    "csv": ".csv",
+}
+
+# Kompresi file parquet antar stage
+PARQUET_COMPRESSION = "zstd"
+
+# Jumlah baris per row group parquet, row group kecil membuat rentang baris bisa dibaca terpisah
+PARQUET_ROW_GROUP_SIZE = 100000
+
+
+def resolve_format(storage_format):
+    if storage_format == "auto":
+        return "parquet" if pa is not None else "csv"
+    if storage_format not in FORMAT_EXTENSIONS:
+        raise ValueError(f"Unknown storage format {storage_format!r}, expected one of {STORAGE_FORMATS}")
+    if storage_format != "csv" and pa is None:
+        raise ImportError(f"Storage format {storage_format!r} requires the pyarrow package")
+    return storage_format
+
+
+def data_path(path, storage_format):
+    """
+    Function yang digunakan untuk mengganti ekstensi file sesuai format penyimpanan,
+    misalnya data/raw/extract_amazon_data.csv menjadi data/raw/extract_amazon_data.parquet.
+    """
+    root, _ = os.path.splitext(path)
+    return root + FORMAT_EXTENSIONS[resolve_format(storage_format)]
+
+
+def _to_arrow(data, schema=None):
+    return pa.Table.from_pandas(data, schema=schema, preserve_index=False)
+
+
+# Tipe arrow untuk tipe Python kolom sumber (misalnya dari tabel database), dipakai untuk kolom
+# yang seluruh nilainya kosong pada batch pertama sehingga tipenya tidak bisa ditebak dari data
+ARROW_PYTHON_TYPES = {
+    "int": "int64",
+    "float": "float64",
+    "Decimal": "float64",
+    "str": "string",
+    "bool": "bool",
+    "datetime": "timestamp[us]",
+    "date": "date32",
+}
+
+
+def _hint_type(python_type):
+    if python_type is None or python_type.__name__ not in ARROW_PYTHON_TYPES:
+        return None
+    return pa.type_for_alias(ARROW_PYTHON_TYPES[python_type.__name__])
+
+
+def _stable_field(field, column_types):
+    # Kolom yang seluruh nilainya kosong pada batch pertama memakai tipe kolom sumber jika diketahui
+    # (selain itu string), dan index kolom category diperlebar, agar batch berikutnya tetap cocok dengan schema file
+    if pa.types.is_null(field.type):
+        return field.with_type(_hint_type(column_types.get(field.name)) or pa.string())
+    if pa.types.is_dictionary(field.type):
+        return field.with_type(pa.dictionary(pa.int32(), field.type.value_type))
+    return field
+
+
+def _stable_schema(table, column_types=None):
+    return pa.schema(
+        [_stable_field(field, column_types or {}) for field in table.schema]
+    ).with_metadata(table.schema.metadata)
+
+
+def _conform(table, schema):
+    # Kolom batch yang tipenya berbeda dengan schema file (misalnya float64 pada kolom yang kosong di batch pertama,
+    # atau int64 vs float64 karena nilai kosong) di-cast ke tipe di schema file
+    columns = []
+    for field in schema:
+        column = table.column(field.name)
+        if not column.type.equals(field.type):
+            try:
+                column = column.cast(field.type)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as error:
+                raise TypeError(
+                    f"Column {field.name!r} is {column.type} in this batch but {field.type} in the file schema"
+                ) from error
+        columns.append(column)
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _open_arrow(source):
+    # File arrow ditulis dalam format IPC stream (kategori boleh berbeda antar batch),
+    # file lama dalam format IPC file tetap bisa dibaca
+    try:
+        return pa.ipc.open_file(source).read_all()
+    except pa.ArrowInvalid:
+        source.seek(0)
+        return pa.ipc.open_stream(source).read_all()
+
+
+def write_frame(data, path, storage_format, **csv_options):
+    """
+    Function yang digunakan untuk menyimpan DataFrame dalam format parquet, arrow (IPC stream), atau csv.
+    Parquet dan arrow menyimpan tipe data (datetime, category, dll) sehingga stage berikutnya
+    tidak perlu mem-parse ulang teks. csv_options hanya dipakai untuk format csv.
+    """
+    storage_format = resolve_format(storage_format)
+
+    if storage_format == "csv":
+        data.to_csv(path, index=False, **csv_options)
+    elif storage_format == "parquet":
+        pq.write_table(_to_arrow(data), path, compression=PARQUET_COMPRESSION, row_group_size=PARQUET_ROW_GROUP_SIZE)
+    else:
+        table = _to_arrow(data)
+        with pa.OSFile(path, "wb") as sink, pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def read_frame(path, storage_format, columns=None):
+    """
+    Function yang digunakan untuk membaca DataFrame yang disimpan oleh write_frame.
+    File arrow dibaca melalui memory map, dan parquet/arrow hanya membaca `columns` jika diberikan.
+    """
+    storage_format = resolve_format(storage_format)
+
+    if storage_format == "csv":
+        return pd.read_csv(path, usecols=columns)
+    if storage_format == "parquet":
+        return pq.read_table(path, columns=columns).to_pandas()
+
+    with pa.memory_map(path, "r") as source:
+        table = _open_arrow(source)
+    if columns is not None:
+        table = table.select(columns)
+    return table.to_pandas()
+
+
+def iter_frames(path, storage_format, chunk_size, columns=None):
+    """
+    Function yang digunakan untuk membaca file per potongan berisi maksimal chunk_size baris,
+    sehingga memory yang dipakai dibatasi ukuran potongan, bukan ukuran file.
+    Parquet dibaca per batch, arrow dibaca melalui memory map lalu dipotong tanpa copy.
+    """
+    storage_format = resolve_format(storage_format)
+
+    if storage_format == "csv":
+        yield from pd.read_csv(path, usecols=columns, chunksize=chunk_size)
+    elif storage_format == "parquet":
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size, columns=columns):
+            yield batch.to_pandas()
+    else:
+        with pa.memory_map(path, "r") as source:
+            table = _open_arrow(source)
+            if columns is not None:
+                table = table.select(columns)
+            for batch in table.to_batches(max_chunksize=chunk_size):
+                yield batch.to_pandas()
+
+
+def count_rows(path, storage_format):
+    """
+    Function yang digunakan untuk menghitung jumlah baris file tanpa memuat seluruh data:
+    parquet dari metadata, arrow dari memory map, csv dengan membaca satu kolom per potongan.
+    """
+    storage_format = resolve_format(storage_format)
+
+    if storage_format == "parquet":
+        return pq.ParquetFile(path).metadata.num_rows
+    if storage_format == "arrow":
+        with pa.memory_map(path, "r") as source:
+            return _open_arrow(source).num_rows
+    return sum(len(chunk) for chunk in pd.read_csv(path, usecols=[0], chunksize=PARQUET_ROW_GROUP_SIZE))
+
+
+def read_range(path, storage_format, start, stop):
+    """
+    Function yang digunakan untuk membaca baris start sampai sebelum stop saja.
+    Parquet hanya membaca row group yang beririsan dengan rentang tersebut dan arrow dipotong dari
+    memory map tanpa copy, sehingga beberapa proses dapat membaca bagiannya masing-masing dari file yang sama.
+    """
+    storage_format = resolve_format(storage_format)
+
+    if storage_format == "csv":
+        # CSV harus dipindai dari awal file untuk setiap rentang, hanya cocok untuk rentang kecil.
+        # Transform paralel tidak memakai jalur ini dan membaca csv per potongan secara berurutan
+        return pd.read_csv(path, skiprows=range(1, start + 1), nrows=stop - start)
+
+    if storage_format == "parquet":
+        parquet_file = pq.ParquetFile(path)
+        groups, offset, first_row = [], 0, None
+        for group in range(parquet_file.num_row_groups):
+            group_rows = parquet_file.metadata.row_group(group).num_rows
+            if offset < stop and offset + group_rows > start:
+                groups.append(group)
+                first_row = offset if first_row is None else first_row
+            offset += group_rows
+        if not groups:
+            return parquet_file.schema_arrow.empty_table().to_pandas()
+        table = parquet_file.read_row_groups(groups)
+        return table.slice(start - first_row, stop - start).to_pandas()
+
+    with pa.memory_map(path, "r") as source:
+        return _open_arrow(source).slice(start, stop - start).to_pandas()
+
+
+class FrameWriter:
+    """
+    Class untuk menulis DataFrame per batch ke satu file (misalnya saat streaming extract),
+    dengan salinan csv opsional di `export_path`.
+    """
+
+    def __init__(self, path, storage_format, export_path=None, column_types=None, **csv_options):
+        self.path = path
+        self.storage_format = resolve_format(storage_format)
+        self.column_types = column_types or {}  # Tipe Python kolom sumber, misalnya {"discount_price": float}
+        self.export_path = export_path if self.storage_format != "csv" else None
+        self.csv_options = csv_options
+        self.rows = 0
+        self._csv_files = {}
+        self._writer = None
+        self._sink = None
+        self._schema = None
+
+    def _write_csv(self, path, batch):
+        # Header hanya ditulis pada batch pertama
+        header = path not in self._csv_files
+        if header:
+            self._csv_files[path] = open(path, "w", newline="", encoding="utf-8")
+        batch.to_csv(self._csv_files[path], index=False, header=header, **self.csv_options)
+
+    def _write_arrow(self, batch):
+        if self._writer is None:
+            self._schema = _stable_schema(_to_arrow(batch), self.column_types)
+            if self.storage_format == "parquet":
+                self._writer = pq.ParquetWriter(self.path, self._schema, compression=PARQUET_COMPRESSION)
+            else:
+                self._sink = pa.OSFile(self.path, "wb")
+                self._writer = pa.ipc.new_stream(self._sink, self._schema)
+        try:
+            table = _to_arrow(batch, schema=self._schema)
+        except (pa.ArrowTypeError, pa.ArrowInvalid):
+            table = _conform(_to_arrow(batch), self._schema)
+        self._writer.write_table(table)
+
+    def write(self, batch):
+        if self.storage_format == "csv":
+            self._write_csv(self.path, batch)
+        else:
+            self._write_arrow(batch)
+        if self.export_path:
+            self._write_csv(self.export_path, batch)
+        self.rows += len(batch)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+        if self._sink is not None:
+            self._sink.close()
+        for csv_file in self._csv_files.values():
+            csv_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class DataFrameTarget(luigi.LocalTarget):
+    """
+    LocalTarget untuk data antar stage pipeline. Ekstensi path mengikuti format penyimpanan
+    (parquet, arrow, atau csv) dan penulisan selalu lewat temporary path sehingga atomic.
+    Jika export_csv aktif, salinan csv ikut ditulis di samping file utama.
+    """
+
+    def __init__(self, path, storage_format="auto", export_csv=False, **csv_options):
+        self.storage_format = resolve_format(storage_format)
+        super().__init__(data_path(path, self.storage_format))
+        self.export_csv = export_csv and self.storage_format != "csv"
+        self.csv_options = csv_options
+
+    @property
+    def export_path(self):
+        return data_path(self.path, "csv") if self.export_csv else None
+
+    def read(self, columns=None):
+        return read_frame(self.path, self.storage_format, columns=columns)
+
+    def read_chunks(self, chunk_size, columns=None):
+        return iter_frames(self.path, self.storage_format, chunk_size, columns=columns)
+
+    def count_rows(self):
+        return count_rows(self.path, self.storage_format)
+
+    def read_range(self, start, stop):
+        return read_range(self.path, self.storage_format, start, stop)
+
+    def write(self, data):
+        self.makedirs()
+        with self.temporary_path() as temp_path:
+            write_frame(data, temp_path, self.storage_format, **self.csv_options)
+        if self.export_csv:
+            write_frame(data, self.export_path, "csv", **self.csv_options)
+
+    def writer(self, temp_path, column_types=None):
+        # Dipakai di dalam `with target.temporary_path() as temp_path` untuk menulis per batch
+        return FrameWriter(temp_path, self.storage_format, export_path=self.export_path, column_types=column_types,
+                           **self.csv_options)
@@ -0,0 +1,269 @@
+import re
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
+NUMERIC_ENGINES = ["auto", "pandas", "pyarrow"]
+
+# Angka desimal yang valid setelah simbol mata uang dan pemisah ribuan dihapus
+_NUMBER_PATTERN = r'^\s*[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?\s*$'
+
+# Label rating pada review_body MyDramalist dan nama kolom hasil ekstraksi
+RATING_LABELS = {
+    'overall_rating': 'Overall',
+    'story_rating': 'Story',
+    'acting_rating': 'Acting/Cast',
+    'music_rating': 'Music',
+    'rewatch_value': 'Rewatch Value',
+}
+
+_RATING_NUMBER = r'\d+(?:\.\d+)?'
+
+# Pattern per label untuk review yang tidak memakai header standar (sama seperti versi awal)
+RATING_PATTERNS = {
+    column: re.compile(rf'{re.escape(label)}\s*({_RATING_NUMBER})', re.IGNORECASE)
+    for column, label in RATING_LABELS.items()
+}
+
+# Format yang paling umum: kelima rating berurutan di awal review lalu isi review.
+# Pada format ini kemunculan pertama setiap label pasti berada di header
+CANONICAL_RATING_PATTERN = re.compile(
+    r'\s*' + r'\s*'.join(
+        rf'{re.escape(label)}\s*(?P<{column}>{_RATING_NUMBER})' for column, label in RATING_LABELS.items()
+    )
+)
+
+# Label rating (case-sensitive) yang memisahkan header rating dengan isi review
+RATING_LABEL_PATTERN = re.compile(
+    '|'.join(rf'{re.escape(label)}\s*{_RATING_NUMBER}' for label in RATING_LABELS.values())
+)
+
+
+def _split_review_body(review_body):
+    # Header standar: satu match ter-anchor untuk kelima rating, isi review adalah sisa teks
+    # selama tidak ada label rating lagi (cek literal dulu karena jauh lebih murah daripada regex)
+    header = CANONICAL_RATING_PATTERN.match(review_body)
+    if header:
+        review_text = review_body[header.end():]
+        if not any(label in review_text for label in RATING_LABELS.values()) \
+                or not RATING_LABEL_PATTERN.search(review_text):
+            return header.groups() + (review_text.strip(),)
+
+    # Format lain: kemunculan pertama setiap label (case-insensitive) dan teks setelah label terakhir
+    ratings = tuple(
+        match.group(1) if match else "0"
+        for match in (pattern.search(review_body) for pattern in RATING_PATTERNS.values())
+    )
+    return ratings + (RATING_LABEL_PATTERN.split(review_body)[-1].strip(),)
+
+
+def extract_ratings(review_body):
+    """
+    Function yang digunakan untuk memecah kolom review_body menjadi lima kolom rating (float)
+    dan kolom reviews (teks setelah label rating terakhir).
+    Rating yang tidak ditemukan bernilai 0.
+
+    Review dengan header rating standar cukup diproses dengan satu pattern yang ter-anchor
+    di awal teks; hanya review dengan format lain yang memakai pattern per label.
+    """
+    columns = list(RATING_LABELS) + ['reviews']
+    ratings = pd.DataFrame(
+        [_split_review_body(body) for body in review_body], columns=columns, index=review_body.index
+    )
+
+    # Pattern hanya menangkap angka, sehingga semua nilai rating pasti bisa dikonversi
+    ratings[list(RATING_LABELS)] = ratings[list(RATING_LABELS)].astype(float)
+    return ratings
+
+
+def _strip_pattern(strip_chars):
+    return f"[{re.escape(strip_chars)}]"
+
+
+def _clean_numeric_pyarrow(values, strip_chars):
+    # Seluruh proses (hapus karakter, validasi, parse) berjalan di compute kernel C++ pyarrow
+    array = pa.array(values, type=pa.string(), from_pandas=True)
+    if strip_chars:
+        array = pc.replace_substring_regex(array, _strip_pattern(strip_chars), "")
+    valid = pc.match_substring_regex(array, _NUMBER_PATTERN)
+    array = pc.if_else(valid, array, pa.scalar(None, pa.string()))
+    return pc.cast(pc.utf8_trim_whitespace(array), pa.float64()).to_numpy(zero_copy_only=False)
+
+
+def _clean_numeric_pandas(values, strip_chars):
+    # Nilai bukan string pada kolom campuran (misalnya 1.0 di antara "2,000") diubah menjadi teks dulu,
+    # karena .str.replace mengubahnya menjadi NaN
+    if values.dtype == object:
+        values = values.astype(str).where(values.notna())
+    if strip_chars:
+        values = values.str.replace(_strip_pattern(strip_chars), "", regex=True)
+    return pd.to_numeric(values, errors='coerce')
+
+
+def clean_numeric(values, strip_chars="₹,", dtype="float32", fill_value=0, engine="auto"):
+    """
+    Function yang digunakan untuk membersihkan kolom angka berbentuk teks (misalnya "₹1,299")
+    dalam satu pass: karakter pada `strip_chars` dihapus, teks diparse menjadi angka,
+    nilai yang kosong atau tidak valid diisi `fill_value`, lalu di-downcast ke `dtype`.
+    ValueError dilempar jika ada nilai di luar jangkauan `dtype` integer.
+    engine "pyarrow" memakai pyarrow.compute, "auto" memakai pyarrow jika terinstall.
+    """
+    if engine == "auto":
+        engine = "pyarrow" if pa is not None else "pandas"
+
+    if is_numeric_dtype(values):
+        numeric = values.to_numpy(dtype=float)
+    elif engine == "pyarrow":
+        try:
+            numeric = _clean_numeric_pyarrow(values, strip_chars)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Kolom campuran (misalnya angka dan teks) tidak bisa langsung menjadi string arrow
+            numeric = _clean_numeric_pandas(values, strip_chars)
+    else:
+        numeric = _clean_numeric_pandas(values, strip_chars)
+
+    numeric = np.where(np.isnan(numeric), fill_value, numeric)
+
+    # Downcast ke integer tidak boleh membuat nilai di luar jangkauan tipe menjadi angka lain (wrap around)
+    target = np.dtype(dtype)
+    if target.kind in "iu":
+        limits = np.iinfo(target)
+        out_of_range = (numeric < limits.min) | (numeric > limits.max)
+        if out_of_range.any():
+            raise ValueError(
+                f"{out_of_range.sum()} values in {values.name} do not fit in {dtype}, e.g. {numeric[out_of_range][:3].tolist()}"
+            )
+    return pd.Series(numeric, index=values.index, name=values.name).astype(dtype)
+
+
+# Aturan normalisasi kolom kategori ProductData: mapping nilai (exact match),
+# regex yang dijalankan setelah mapping, dan cara mengisi nilai kosong
+PRODUCT_NORMALIZATION_RULES = {
+    'Availability': {
+        'map': {
+            'Yes': 'In Stock', 'In Stock': 'In Stock', 'TRUE': 'In Stock',
+            'undefined': 'Sold', 'yes': 'In Stock', 'Out Of Stock': 'Sold',
+            'Special Order': 'In Stock', 'No': 'Sold', 'More on the Way': 'Sold',
+            'sold': 'Sold', 'FALSE': 'Sold', 'Retired': 'Sold', '32 available:': 'In Stock',
+            '7 available': 'In Stock'
+        },
+    },
+    'Condition': {
+        'map': {
+            'New': 'New', 'new': 'New', 'Seller refurbished': 'Used',
+            'Used': 'Used', 'pre-owned': 'Used', 'Refurbished': 'Used',
+            'Manufacturer refurbished': 'Used'
+        },
+    },
+    'isSale': {
+        'map': {False: 'No', True: 'Yes'},
+    },
+    'Shipping': {
+        'map': {
+            'Expedited': 'Charges Apply', 'Value': 'Charges Apply',
+            'Standard': 'Charges Apply', 'Free Shipping on orders 35 and up': 'Free Shipping',
+            'Free Expedited Shipping': 'Free Shipping',
+            'Free Expedited Shipping for most orders over $49': 'Free Shipping',
+            'FREE': 'Free Shipping', 'Freight': 'Charges Apply',
+            'Free Shipping for this Item': 'Free Shipping',
+            'Free Standard Shipping on Orders Over $49': 'Free Shipping',
+            'Free Delivery': 'Free Shipping',
+            'Free Standard Shipping': 'Free Shipping',
+            'Shipping Charges Apply': 'Charges Apply',
+            'Free Next Day Delivery (USA)': 'Free Shipping'
+        },
+        # Nilai Shipping yang mengandung USD/CAD
+        'regex': [(r'.*\bUSD\b.*|.*\bCAD\b.*', 'Charges Apply')],
+        'fill': 'bfill',
+    },
+}
+
+
+def normalize_categorical(values, rule):
+    """
+    Function yang digunakan untuk menormalisasi satu kolom berdasarkan aturan (map, regex, fill).
+    Kolom diubah menjadi category terlebih dahulu sehingga mapping dan regex hanya dijalankan
+    sekali per nilai unik, bukan per baris. Hasilnya tetap bertipe category.
+    """
+    mapping = rule.get('map', {})
+    patterns = [(re.compile(pattern), replacement) for pattern, replacement in rule.get('regex', [])]
+
+    def normalize(value):
+        value = mapping.get(value, value)
+        if isinstance(value, str):
+            for pattern, replacement in patterns:
+                value = pattern.sub(replacement, value)
+        return value
+
+    categorical = values.astype('category')
+    normalized = [normalize(value) for value in categorical.cat.categories]
+
+    # Beberapa kategori lama bisa menjadi satu kategori baru, sehingga codes dipetakan ulang
+    categories = pd.unique(pd.Series(normalized, dtype=object))
+    code_map = pd.Index(categories).get_indexer(normalized)
+    codes = categorical.cat.codes.to_numpy()
+    new_codes = np.where(codes < 0, -1, code_map[np.maximum(codes, 0)]) if len(code_map) else codes
+
+    result = pd.Series(
+        pd.Categorical.from_codes(new_codes, categories=categories), index=values.index, name=values.name
+    )
+    if rule.get('fill') == 'bfill':
+        result = result.bfill()
+    return result
+
+
+def _concat_frames(frames):
+    # Kolom category pada setiap potongan bisa memiliki kategori berbeda,
+    # kategori disatukan dulu agar hasil concat tetap bertipe category
+    for col in frames[0].columns:
+        if isinstance(frames[0][col].dtype, pd.CategoricalDtype):
+            categories = pd.api.types.union_categoricals([frame[col] for frame in frames]).categories
+            frames = [frame.assign(**{col: frame[col].cat.set_categories(categories)}) for frame in frames]
+    return pd.concat(frames, ignore_index=True)
+
+
+def _split_unresolved(data, backfill_columns):
+    # Baris setelah nilai valid terakhir pada salah satu kolom bfill belum bisa diisi,
+    # karena nilai pengisinya baru ada di potongan berikutnya
+    cut = len(data)
+    for col in backfill_columns:
+        valid = np.flatnonzero(data[col].notna().to_numpy())
+        cut = min(cut, valid[-1] + 1 if len(valid) else 0)
+    return data.iloc[:cut], data.iloc[cut:]
+
+
+def transform_in_chunks(chunks, transform, write, backfill_columns=()):
+    """
+    Function yang digunakan untuk menjalankan transform per potongan data lalu menulis hasilnya
+    dengan `write`, sehingga memory dibatasi ukuran potongan. Untuk kolom pada backfill_columns,
+    baris di akhir potongan yang masih kosong ditahan dan di-backfill bersama potongan berikutnya,
+    sehingga hasilnya sama dengan bfill pada seluruh data.
+    Mengembalikan jumlah baris yang ditulis.
+    """
+    backfill_columns = list(backfill_columns)
+    pending = None
+    rows = 0
+
+    for chunk in chunks:
+        data = transform(chunk)
+        if backfill_columns:
+            if pending is not None and len(pending):
+                data = _concat_frames([pending, data])
+                data[backfill_columns] = data[backfill_columns].bfill()
+            data, pending = _split_unresolved(data, backfill_columns)
+        if len(data):
+            write(data)
+            rows += len(data)
+
+    # Sisa baris yang tidak memiliki nilai pengisi tetap kosong, sama seperti bfill biasa
+    if pending is not None and len(pending):
+        write(pending)
+        rows += len(pending)
+    return rows
@@ -0,0 +1,94 @@
+import json
+import os
+
+import pandas as pd
+
+# Lokasi file state untuk menyimpan high-water mark setiap sumber data (di dalam ETL_DATA_DIR)
+WATERMARK_FILE = os.path.join(os.getenv("ETL_DATA_DIR", "/Users/user/data-eng/data"), "state", "watermark.json")
+
+
+def _read_state(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as state_file:
+        return json.load(state_file)
+
+
+def _write_state(state, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    # Menulis ke file sementara lalu rename agar state tidak pernah setengah tertulis
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as state_file:
+        json.dump(state, state_file, indent=2)
+    os.replace(temp_path, path)
+
+
+def _to_json_value(value):
+    # Mengubah nilai numpy/pandas menjadi tipe yang bisa disimpan di JSON
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if hasattr(value, "item"):
+        return value.item()
+    return value
+
+
+def read_watermark(source, column, path=WATERMARK_FILE):
+    """
+    Function yang digunakan untuk membaca high-water mark terakhir
+    yang sudah berhasil di-load untuk sebuah sumber data.
+    Mengembalikan None jika belum ada watermark atau kolomnya berbeda.
+    """
+    entry = _read_state(path).get(source, {})
+    if entry.get("column") != column:
+        return None
+    return entry.get("value")
+
+
+def stage_watermark(source, column, value, full_extract=False, path=WATERMARK_FILE):
+    """
+    Function yang digunakan untuk menyimpan watermark baru sebagai pending.
+    Watermark pending baru dipakai setelah commit_watermark dipanggil oleh proses load,
+    sehingga kegagalan di tengah pipeline tidak membuat data baru terlewat.
+    full_extract menandai bahwa extract mengambil seluruh tabel (belum ada watermark), bukan delta.
+    """
+    state = _read_state(path)
+    entry = state.setdefault(source, {})
+    if entry.get("column") != column:
+        entry.clear()
+        entry["column"] = column
+    entry["pending"] = _to_json_value(value)
+    entry["pending_full_extract"] = full_extract
+    _write_state(state, path)
+
+
+def has_pending_watermark(source, path=WATERMARK_FILE):
+    """
+    Function yang digunakan untuk memeriksa apakah ada watermark pending,
+    yaitu delta yang sudah di-extract tetapi belum di-load.
+    """
+    return "pending" in _read_state(path).get(source, {})
+
+
+def is_pending_full_extract(source, path=WATERMARK_FILE):
+    """
+    Function yang digunakan untuk memeriksa apakah data pending berasal dari extract seluruh tabel,
+    sehingga harus di-load dengan menggantikan isi tabel dan bukan di-append.
+    """
+    entry = _read_state(path).get(source, {})
+    return "pending" in entry and entry.get("pending_full_extract", False)
+
+
+def commit_watermark(source, path=WATERMARK_FILE):
+    """
+    Function yang digunakan untuk memindahkan watermark pending menjadi watermark aktif.
+    Mengembalikan watermark yang di-commit atau None jika tidak ada pending.
+    """
+    state = _read_state(path)
+    entry = state.get(source, {})
+    if "pending" not in entry:
+        return None
+    entry["value"] = entry.pop("pending")
+    entry.pop("pending_full_extract", None)
+    _write_state(state, path)
+    return entry["value"]